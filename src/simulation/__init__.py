@@ -3,13 +3,34 @@ Simulation Engine - Core ABM logic for SDLC SimLab
 
 This module contains the agent-based modeling engine that simulates
 software development team dynamics.
+
+Public names are imported lazily on first access, so importing a light
+submodule (e.g. ``src.simulation.agents``) does not pull in the engine,
+pydantic, YAML and NumPy.
 """
 
-from .engine import SDLCSimulation
-from .runner import ScenarioRunner
-from .comparison import ScenarioComparison, ScenarioResult
-from .config import ScenarioConfig
-from .agents import Developer, DeveloperConfig, AIAgent, AIAgentConfig
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .engine import SDLCSimulation
+    from .runner import ScenarioRunner
+    from .comparison import ScenarioComparison, ScenarioResult
+    from .config import ScenarioConfig
+    from .agents import Developer, DeveloperConfig, AIAgent, AIAgentConfig
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'SDLCSimulation': '.engine',
+    'ScenarioRunner': '.runner',
+    'ScenarioComparison': '.comparison',
+    'ScenarioResult': '.comparison',
+    'ScenarioConfig': '.config',
+    'Developer': '.agents',
+    'DeveloperConfig': '.agents',
+    'AIAgent': '.agents',
+    'AIAgentConfig': '.agents',
+}
 
 __all__ = [
     'SDLCSimulation',
@@ -22,3 +43,18 @@ __all__ = [
     'AIAgent',
     'AIAgentConfig',
 ]
+
+
+def __getattr__(name: str):
+    """Import public names on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,6 +10,7 @@ AI-powered code generation and assistance:
 - Different cost structure
 """
 
+import random
 from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 
@@ -22,7 +23,7 @@ if TYPE_CHECKING:
     from ..engine import SDLCSimulation
 
 
-@dataclass
+@dataclass(slots=True)
 class AIAgentConfig:
     """
     Configuration for an AI Agent.
@@ -147,12 +148,10 @@ class AIAgent(Developer):
         """
         # AI agents work 24/7, so we use a daily rate that accounts for continuous operation
         # productivity_rate is already tuned for 24/7 work (higher than humans)
-        import random
-
         prs_per_day = self.config.productivity_rate / 7.0  # Convert weekly to daily
 
         # Probabilistic PR creation
-        if random.random() < prs_per_day:
+        if (context.rng or random).random() < prs_per_day:
             self.create_pr(context)
 
     def create_pr(self, context: SimulationContext) -> PullRequest:
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     from ..engine import SDLCSimulation
 
 
-@dataclass
+@dataclass(slots=True)
 class DeveloperConfig:
     """
     Configuration for a Developer agent.
@@ -159,13 +159,11 @@ class Developer(Agent):
         if self.is_fully_onboarded:
             return
 
-        if self.weeks_in_role >= self.config.onboarding_time:
-            self.is_fully_onboarded = True
-            self.config.current_productivity_multiplier = 1.0
-        else:
-            # Linear ramp-up (could make this non-linear later)
-            progress = self.weeks_in_role / self.config.onboarding_time
-            self.config.current_productivity_multiplier = progress
+        # Linear ramp-up capped at full productivity (could make this non-linear later)
+        onboarding_time = self.config.onboarding_time
+        progress = min(1.0, self.weeks_in_role / onboarding_time) if onboarding_time else 1.0
+        self.config.current_productivity_multiplier = progress
+        self.is_fully_onboarded = progress >= 1.0
 
     def _work_on_prs(self, context: SimulationContext) -> None:
         """
@@ -182,7 +180,7 @@ class Developer(Agent):
         )
 
         # Probabilistic PR creation
-        if random.random() < prs_per_day:
+        if (context.rng or random).random() < prs_per_day:
             self.create_pr(context)
 
     def create_pr(self, context: SimulationContext) -> PullRequest:
@@ -198,7 +196,7 @@ class Developer(Agent):
             The created PR
         """
         # Determine if this PR will succeed or need rework
-        will_succeed = random.random() < self.config.code_quality
+        will_succeed = (context.rng or random).random() < self.config.code_quality
 
         pr = PullRequest(
             author_id=self.agent_id,
@@ -232,17 +230,17 @@ class Developer(Agent):
         # Calculate daily review completion probability
         reviews_per_day = self.config.review_capacity / 5.0
 
-        # Try to complete reviews
-        completed = []
+        # Try to complete reviews, keeping the rest pending in a single pass
+        rng = context.rng or random
+        remaining = []
         for review in self.pending_reviews:
-            if random.random() < reviews_per_day:
+            if rng.random() < reviews_per_day:
                 review.complete(context.current_day, approved=True)
-                completed.append(review)
                 self.total_reviews_completed += 1
+            else:
+                remaining.append(review)
 
-        # Remove completed reviews
-        for review in completed:
-            self.pending_reviews.remove(review)
+        self.pending_reviews[:] = remaining
 
     def assign_review(self, pr: PullRequest, context: SimulationContext) -> CodeReview:
         """
@@ -278,8 +276,10 @@ class Developer(Agent):
         self.total_prs_merged += 1
 
         # Remove from active PRs
-        if pr in self.active_prs:
+        try:
             self.active_prs.remove(pr)
+        except ValueError:
+            pass
 
     def revert_pr(self, pr: PullRequest, context: SimulationContext) -> None:
         """
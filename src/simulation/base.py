@@ -4,24 +4,26 @@ Base classes for the SDLC SimLab simulation engine.
 This module provides the foundational abstractions for building agent-based models.
 """
 
+import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimulationContext:
     """
     Context object passed to agents during simulation steps.
 
     Contains information about the current simulation state that agents
-    need to make decisions.
+    need to make decisions. A fresh, immutable context is built each step.
     """
     current_day: int
     current_week: int
     random_seed: Optional[int] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    rng: Optional[random.Random] = None  # Simulation's RNG; None means the global random module
 
     @property
     def current_timestep(self) -> int:
@@ -73,34 +75,23 @@ class Agent(ABC):
         return f"{self.__class__.__name__}(id={self.agent_id[:8]}...)"
 
 
+@dataclass(frozen=True, slots=True, eq=False)
 class SimulationEvent:
     """
     Represents an event that occurred during simulation.
 
-    Events are used for logging, metrics calculation, and debugging.
+    Events are used for logging, metrics calculation, and debugging. They
+    are immutable once logged and compare and hash by identity.
     """
+    event_type: str  # e.g. "pr_created", "pr_merged", "incident"
+    timestep: int  # When the event occurred
+    agent_id: Optional[str] = None  # Agent that triggered the event (if applicable)
+    data: Optional[Dict[str, Any]] = None  # Additional event data; None becomes {}
+    event_id: str = field(default_factory=lambda: str(uuid4()), init=False)
 
-    def __init__(
-        self,
-        event_type: str,
-        timestep: int,
-        agent_id: Optional[str] = None,
-        data: Optional[Dict[str, Any]] = None
-    ):
-        """
-        Initialize a simulation event.
-
-        Args:
-            event_type: Type of event (e.g., "pr_created", "pr_merged", "incident")
-            timestep: When the event occurred
-            agent_id: Agent that triggered the event (if applicable)
-            data: Additional event data
-        """
-        self.event_id = str(uuid4())
-        self.event_type = event_type
-        self.timestep = timestep
-        self.agent_id = agent_id
-        self.data = data or {}
+    def __post_init__(self) -> None:
+        if not self.data:
+            object.__setattr__(self, 'data', {})
 
     def __repr__(self) -> str:
         return f"SimulationEvent(type={self.event_type}, timestep={self.timestep})"
@@ -118,7 +109,8 @@ class Simulation:
         self,
         name: str = "SDLC Simulation",
         timestep_days: int = 1,
-        random_seed: Optional[int] = None
+        random_seed: Optional[int] = None,
+        log_events: bool = True
     ):
         """
         Initialize the simulation.
@@ -127,16 +119,24 @@ class Simulation:
             name: Human-readable name for this simulation
             timestep_days: Number of days each timestep represents (default: 1)
             random_seed: Seed for random number generation (for reproducibility)
+            log_events: Record events (disable for runs that only need metrics)
         """
         self.name = name
         self.timestep_days = timestep_days
         self.random_seed = random_seed
+        self.log_events = log_events
+        # Per-simulation RNG, so concurrent simulations don't share state
+        self.rng = random.Random(random_seed)
 
         self.agents: List[Agent] = []
         self.current_timestep: int = 0
         self.events: List[SimulationEvent] = []
         self.is_running: bool = False
 
+        # Event indexes for the get_events_by_* lookups, maintained by log_event
+        self._events_by_type: Dict[str, List[SimulationEvent]] = {}
+        self._events_by_agent: Dict[Optional[str], List[SimulationEvent]] = {}
+
     def add_agent(self, agent: Agent) -> None:
         """
         Add an agent to the simulation.
@@ -178,6 +178,9 @@ class Simulation:
         """
         Log an event that occurred during simulation.
 
+        When event logging is disabled the event is created but not recorded,
+        so events and the get_events_by_* lookups stay empty.
+
         Args:
             event_type: Type of event
             agent_id: Agent that triggered the event
@@ -192,7 +195,12 @@ class Simulation:
             agent_id=agent_id,
             data=data
         )
+        if not self.log_events:
+            return event
+
         self.events.append(event)
+        self._events_by_type.setdefault(event_type, []).append(event)
+        self._events_by_agent.setdefault(agent_id, []).append(event)
         return event
 
     def get_context(self) -> SimulationContext:
@@ -205,7 +213,8 @@ class Simulation:
         return SimulationContext(
             current_day=self.current_timestep,
             current_week=self.current_timestep // 7,
-            random_seed=self.random_seed
+            random_seed=self.random_seed,
+            rng=self.rng
         )
 
     def step(self) -> None:
@@ -231,10 +240,11 @@ class Simulation:
         """
         self.is_running = True
 
+        step = self.step
         for _ in range(num_steps):
             if not self.is_running:
                 break
-            self.step()
+            step()
 
         self.is_running = False
 
@@ -246,6 +256,8 @@ class Simulation:
         """Reset the simulation to initial state."""
         self.current_timestep = 0
         self.events.clear()
+        self._events_by_type.clear()
+        self._events_by_agent.clear()
         self.agents.clear()
         self.is_running = False
 
@@ -259,7 +271,7 @@ class Simulation:
         Returns:
             List of matching events
         """
-        return [e for e in self.events if e.event_type == event_type]
+        return list(self._events_by_type.get(event_type, ()))
 
     def get_events_by_agent(self, agent_id: str) -> List[SimulationEvent]:
         """
@@ -271,7 +283,7 @@ class Simulation:
         Returns:
             List of matching events
         """
-        return [e for e in self.events if e.agent_id == agent_id]
+        return list(self._events_by_agent.get(agent_id, ()))
 
     def __repr__(self) -> str:
         return (
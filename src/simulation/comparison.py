@@ -14,19 +14,23 @@ Usage:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
-import json
-import csv
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import IO, Callable, List, Dict, Any, Optional, Union
+import hashlib
+import io
+import os
+
+import numpy as np
 
 from .config import ScenarioConfig
 from .runner import ScenarioRunner
+from .serialization import dumps_json
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScenarioResult:
-    """Results from running a single scenario."""
+    """Results from running a single scenario (immutable once created)."""
     name: str
     description: Optional[str]
     metrics: Dict[str, Any]
@@ -37,6 +41,149 @@ class ScenarioResult:
         return self.metrics.get(key, default)
 
 
+# Descriptive fields that don't affect a scenario's simulated outcome
+_LABEL_FIELDS = {'name', 'description', 'tags', 'author', 'created_at'}
+
+
+def _metrics_cache_enabled() -> bool:
+    """Whether the on-disk metrics cache is switched on (SDLC_METRICS_CACHE)."""
+    return os.environ.get("SDLC_METRICS_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def _metrics_cache_path() -> Path:
+    """Shelf location, under SDLC_CACHE_DIR or ~/.cache/sdlc_abm."""
+    cache_dir = os.environ.get("SDLC_CACHE_DIR") or Path.home() / ".cache" / "sdlc_abm"
+    return Path(cache_dir) / "metrics"
+
+
+@lru_cache(maxsize=1)
+def _source_fingerprint() -> str:
+    """Hash of the simulation package source, so code changes invalidate the cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    package_dir = Path(__file__).parent
+    for path in sorted(package_dir.rglob("*.py")):
+        digest.update(path.relative_to(package_dir).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _metrics_cache_key(config: ScenarioConfig) -> str:
+    """Disk cache key for a seeded scenario: its configuration (excluding labels) and the source."""
+    config_json = config.model_dump_json(exclude=_LABEL_FIELDS)
+    return hashlib.blake2b(
+        (_source_fingerprint() + config_json).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _run_with_metrics_cache(
+    configs: List[ScenarioConfig],
+    run: Callable[[List[ScenarioConfig]], List[ScenarioResult]]
+) -> List[ScenarioResult]:
+    """
+    Run scenarios, serving seeded ones from the on-disk metrics cache.
+
+    Only used when SDLC_METRICS_CACHE is set. The shelf is read before
+    ``run`` is called on the misses and written after it returns, all in the
+    calling process, so worker processes never open it. The shelf has no
+    locking: separate processes (e.g. pytest-xdist workers) must not use the
+    same cache directory at once, or entries are lost.
+
+    Args:
+        configs: Scenarios to run
+        run: Runs a list of scenarios, returning results in the same order
+
+    Returns:
+        Results in the order of configs
+    """
+    if not _metrics_cache_enabled():
+        return run(configs)
+
+    import shelve
+
+    keys = [
+        _metrics_cache_key(config) if config.simulation.random_seed is not None else None
+        for config in configs
+    ]
+    path = _metrics_cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with shelve.open(str(path)) as shelf:
+        cached = {key: shelf[key] for key in keys if key is not None and key in shelf}
+
+    misses = [config for config, key in zip(configs, keys) if key not in cached]
+    fresh = iter(run(misses) if misses else [])
+
+    results = []
+    new_entries = {}
+    for config, key in zip(configs, keys):
+        if key in cached:
+            results.append(ScenarioResult(
+                name=config.name,
+                description=config.description,
+                metrics=dict(cached[key]),
+                config=config
+            ))
+        else:
+            result = next(fresh)
+            results.append(result)
+            if key is not None:
+                new_entries[key] = result.metrics
+
+    if new_entries:
+        with shelve.open(str(path)) as shelf:
+            shelf.update(new_entries)
+
+    return results
+
+
+def _is_binary_handle(f: IO) -> bool:
+    """
+    Whether a file object takes bytes rather than str.
+
+    Wrappers such as tempfile.NamedTemporaryFile aren't io subclasses, so
+    fall back to their mode.
+    """
+    return isinstance(f, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(f, 'mode', '')
+
+
+def _destination_name(dest: Union[str, Path, IO]) -> str:
+    """Printable name of an export destination (path, file name or "stream")."""
+    if isinstance(dest, (str, os.PathLike)):
+        return str(dest)
+    return str(getattr(dest, 'name', 'stream'))
+
+
+@lru_cache(maxsize=32)
+def _run_seeded(config_json: str) -> Dict[str, Any]:
+    """
+    Run a seeded scenario quietly, memoized on its serialized configuration.
+
+    Seeded runs are deterministic, so identical configurations share metrics.
+    Callers must copy the returned dict before handing it out.
+    """
+    config = ScenarioConfig.model_validate_json(config_json)
+    return ScenarioRunner(config, log_events=False).run(verbose=False)
+
+
+def _run_scenario(config: ScenarioConfig) -> ScenarioResult:
+    """
+    Run a single scenario quietly and wrap its metrics.
+
+    Seeded scenarios are served from a per-process cache keyed on their
+    configuration (excluding labels). Defined at module level so it can be
+    pickled for worker processes.
+    """
+    if config.simulation.random_seed is not None:
+        metrics = dict(_run_seeded(config.model_dump_json(exclude=_LABEL_FIELDS)))
+    else:
+        metrics = ScenarioRunner(config, log_events=False).run(verbose=False)
+    return ScenarioResult(
+        name=config.name,
+        description=config.description,
+        metrics=metrics,
+        config=config
+    )
+
+
 class ScenarioComparison:
     """
     Compare multiple simulation scenarios.
@@ -89,12 +236,14 @@ class ScenarioComparison:
         for scenario in scenarios:
             self.add_scenario(scenario)
 
-    def run_all(self, parallel: bool = False) -> List[ScenarioResult]:
+    def run_all(self, parallel: bool = False, max_workers: Optional[int] = None) -> List[ScenarioResult]:
         """
         Run all scenarios and collect results.
 
         Args:
             parallel: Run scenarios in parallel (faster but uses more resources)
+            max_workers: Worker processes for parallel runs (default: one per
+                scenario, capped at the CPU count)
 
         Returns:
             List of scenario results
@@ -108,7 +257,7 @@ class ScenarioComparison:
             print(f"{'='*80}\n")
 
         if parallel:
-            self.results = self._run_parallel()
+            self.results = self._run_parallel(max_workers)
         else:
             self.results = self._run_sequential()
 
@@ -120,7 +269,18 @@ class ScenarioComparison:
         return self.results
 
     def _run_sequential(self) -> List[ScenarioResult]:
-        """Run scenarios one at a time."""
+        """
+        Run scenarios one at a time.
+
+        Quiet runs go through _run_scenario and reuse cached results for
+        previously run seeded configurations. Verbose runs always simulate
+        so the per-scenario summary can be printed.
+        """
+        if not self.verbose:
+            return _run_with_metrics_cache(
+                self.scenarios, lambda configs: [_run_scenario(c) for c in configs]
+            )
+
         results = []
 
         for i, config in enumerate(self.scenarios, 1):
@@ -128,7 +288,7 @@ class ScenarioComparison:
                 print(f"\n[{i}/{len(self.scenarios)}] Running: {config.name}")
                 print("-" * 80)
 
-            runner = ScenarioRunner(config)
+            runner = ScenarioRunner(config, log_events=False)
             metrics = runner.run(verbose=self.verbose)
 
             results.append(ScenarioResult(
@@ -140,40 +300,30 @@ class ScenarioComparison:
 
         return results
 
-    def _run_parallel(self) -> List[ScenarioResult]:
-        """Run scenarios in parallel using ProcessPoolExecutor."""
-        results = []
+    def _run_parallel(self, max_workers: Optional[int] = None) -> List[ScenarioResult]:
+        """
+        Run scenarios in parallel using ProcessPoolExecutor.
 
+        Each scenario seeds its own simulation, so results match a
+        sequential run. Results are returned in the order scenarios were added.
+        With the on-disk metrics cache enabled, only cache misses are sent to
+        the workers.
+        """
         if self.verbose:
             print(f"Running {len(self.scenarios)} scenarios in parallel...\n")
 
-        def run_scenario(config: ScenarioConfig) -> ScenarioResult:
-            """Helper function for parallel execution."""
-            runner = ScenarioRunner(config)
-            metrics = runner.run(verbose=False)  # Disable verbose in parallel mode
-            return ScenarioResult(
-                name=config.name,
-                description=config.description,
-                metrics=metrics,
-                config=config
-            )
+        from concurrent.futures import ProcessPoolExecutor
 
-        with ProcessPoolExecutor() as executor:
-            futures = {executor.submit(run_scenario, config): config
-                      for config in self.scenarios}
+        def run_in_pool(configs: List[ScenarioConfig]) -> List[ScenarioResult]:
+            workers = max_workers or min(len(configs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_run_scenario, configs))
 
-            for future in as_completed(futures):
-                config = futures[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    if self.verbose:
-                        print(f"✓ Completed: {config.name}")
-                except Exception as e:
-                    print(f"✗ Failed: {config.name} - {e}")
+        results = _run_with_metrics_cache(self.scenarios, run_in_pool)
 
-        # Sort results to match original order
-        results.sort(key=lambda r: [s.name for s in self.scenarios].index(r.name))
+        if self.verbose:
+            for result in results:
+                print(f"✓ Completed: {result.name}")
 
         return results
 
@@ -208,17 +358,26 @@ class ScenarioComparison:
             'insights': []
         }
 
-        for metric_key, metric_name, higher_is_better in metrics_to_compare:
-            values = [r.get_metric(metric_key) for r in self.results]
+        # One row per metric, one column per scenario
+        rows = [[r.get_metric(key) for r in self.results] for key, _, _ in metrics_to_compare]
+        matrix = np.array(rows, dtype=float)
+
+        # argmax/argmin pick the first scenario on ties; zero values never
+        # win a lower-is-better metric
+        has_values = matrix.any(axis=1)
+        highest = np.argmax(matrix, axis=1)
+        lowest = np.argmin(np.where(matrix > 0, matrix, np.inf), axis=1)
+
+        for row, (metric_key, metric_name, higher_is_better) in enumerate(metrics_to_compare):
+            values = rows[row]
 
             # Find best scenario for this metric
-            if all(v == 0 for v in values):
+            if not has_values[row]:
                 best_idx = None
             elif higher_is_better:
-                best_idx = values.index(max(values))
+                best_idx = int(highest[row])
             else:
-                non_zero_values = [v if v > 0 else float('inf') for v in values]
-                best_idx = non_zero_values.index(min(non_zero_values))
+                best_idx = int(lowest[row])
 
             comparison['metrics'][metric_key] = {
                 'name': metric_name,
@@ -244,40 +403,39 @@ class ScenarioComparison:
         if not self.results:
             return insights
 
-        # Throughput leader
-        throughputs = [(r.name, r.get_metric('prs_per_week')) for r in self.results]
-        best_throughput = max(throughputs, key=lambda x: x[1])
+        names = [r.name for r in self.results]
+        throughputs = np.array([r.get_metric('prs_per_week') for r in self.results], dtype=float)
+        failure_rates = np.array([r.get_metric('change_failure_rate') for r in self.results], dtype=float)
+        ai_costs = np.array([r.get_metric('ai_total_cost') for r in self.results], dtype=float)
+        has_ai = np.array([r.get_metric('ai_agents', 0) > 0 for r in self.results])
+
+        # Throughput leader (argmax/argmin keep the first scenario on ties)
+        best = int(np.argmax(throughputs))
         insights.append(
-            f"Highest throughput: {best_throughput[0]} with {best_throughput[1]:.1f} PRs/week"
+            f"Highest throughput: {names[best]} with {throughputs[best]:.1f} PRs/week"
         )
 
-        # Quality leader (lowest failure rate)
-        failure_rates = [(r.name, r.get_metric('change_failure_rate'))
-                        for r in self.results if r.get_metric('change_failure_rate') > 0]
-        if failure_rates:
-            best_quality = min(failure_rates, key=lambda x: x[1])
+        # Quality leader (lowest non-zero failure rate)
+        has_failures = failure_rates > 0
+        if has_failures.any():
+            best = int(np.argmin(np.where(has_failures, failure_rates, np.inf)))
             insights.append(
-                f"Best quality: {best_quality[0]} with {best_quality[1]:.1%} failure rate"
+                f"Best quality: {names[best]} with {failure_rates[best]:.1%} failure rate"
             )
 
         # Cost efficiency (if AI agents present)
-        ai_costs = [(r.name, r.get_metric('ai_total_cost'), r.get_metric('prs_per_week'))
-                   for r in self.results if r.get_metric('ai_agents', 0) > 0]
-        if ai_costs:
+        if has_ai.any():
             # Calculate PRs per dollar
-            efficiencies = [(name, prs/max(cost, 0.01)) for name, cost, prs in ai_costs]
-            best_efficiency = max(efficiencies, key=lambda x: x[1])
+            efficiencies = throughputs / np.maximum(ai_costs, 0.01)
+            best = int(np.argmax(np.where(has_ai, efficiencies, -np.inf)))
             insights.append(
-                f"Most cost-efficient: {best_efficiency[0]} with {best_efficiency[1]:.1f} PRs/$"
+                f"Most cost-efficient: {names[best]} with {efficiencies[best]:.1f} PRs/$"
             )
 
         # Team composition insights
-        all_human = [r for r in self.results if r.get_metric('ai_agents', 0) == 0]
-        mixed_teams = [r for r in self.results if r.get_metric('ai_agents', 0) > 0]
-
-        if all_human and mixed_teams:
-            avg_human_throughput = sum(r.get_metric('prs_per_week') for r in all_human) / len(all_human)
-            avg_mixed_throughput = sum(r.get_metric('prs_per_week') for r in mixed_teams) / len(mixed_teams)
+        if has_ai.any() and not has_ai.all():
+            avg_human_throughput = float(throughputs[~has_ai].mean())
+            avg_mixed_throughput = float(throughputs[has_ai].mean())
 
             if avg_mixed_throughput > avg_human_throughput:
                 improvement = ((avg_mixed_throughput / avg_human_throughput) - 1) * 100
@@ -356,12 +514,12 @@ class ScenarioComparison:
 
         print(f"\n{'='*100}\n")
 
-    def export_to_json(self, filepath: Union[str, Path]) -> None:
+    def export_to_json(self, dest: Union[str, Path, IO]) -> None:
         """
         Export comparison results to JSON.
 
         Args:
-            filepath: Path to save JSON file
+            dest: Path to save JSON file, or an open text or binary file object
         """
         if not self.results:
             raise ValueError("No results available. Run run_all() first.")
@@ -381,40 +539,54 @@ class ScenarioComparison:
             ]
         }
 
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        data = dumps_json(export_data, indent=True)
 
-        with open(path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if isinstance(dest, (str, os.PathLike)):
+            path = Path(dest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(path, 'wb') as f:
+                f.write(data)
+        else:
+            dest.write(data if _is_binary_handle(dest) else data.decode('utf-8'))
 
         if self.verbose:
-            print(f"Comparison exported to: {filepath}")
+            print(f"Comparison exported to: {_destination_name(dest)}")
 
-    def export_to_csv(self, filepath: Union[str, Path]) -> None:
+    def export_to_csv(self, dest: Union[str, Path, IO[str]]) -> None:
         """
         Export comparison results to CSV.
 
         Args:
-            filepath: Path to save CSV file
+            dest: Path to save CSV file, or an open text file object
         """
         if not self.results:
             raise ValueError("No results available. Run run_all() first.")
 
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(dest, (str, os.PathLike)):
+            path = Path(dest)
+            path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, 'w', newline='') as f:
-            writer = csv.writer(f)
+            with open(path, 'w', newline='') as f:
+                self._write_csv(f)
+        else:
+            self._write_csv(dest)
 
-            # Write header
-            header = ['Metric'] + [r.name for r in self.results]
-            writer.writerow(header)
+        if self.verbose:
+            print(f"Comparison exported to: {_destination_name(dest)}")
 
-            # Write metrics
-            comparison = self.get_comparison_table()
-            for metric_key, metric_data in comparison['metrics'].items():
-                row = [metric_data['name']] + metric_data['values']
-                writer.writerow(row)
+    def _write_csv(self, f: IO[str]) -> None:
+        """Write metrics as rows and scenarios as columns to a text file object."""
+        import csv
 
-        if self.verbose:
-            print(f"Comparison exported to: {filepath}")
+        writer = csv.writer(f)
+
+        # Write header
+        header = ['Metric'] + [r.name for r in self.results]
+        writer.writerow(header)
+
+        # Write metrics
+        comparison = self.get_comparison_table()
+        for metric_key, metric_data in comparison['metrics'].items():
+            row = [metric_data['name']] + metric_data['values']
+            writer.writerow(row)
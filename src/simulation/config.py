@@ -5,15 +5,14 @@ Supports loading/saving simulation configurations from YAML/JSON files.
 """
 
 from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Union
+import importlib.util
 import json
 
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# PyYAML is only imported when a YAML file is read or written
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -22,6 +21,20 @@ from .agents.developer import DeveloperConfig
 from .agents.ai_agent import AIAgentConfig
 
 
+@lru_cache(maxsize=64)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on its path and modification time.
+
+    Editing the file changes its mtime, so stale entries are never returned.
+    Callers must treat the returned dict as read-only.
+    """
+    import yaml
+
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+
 class DeveloperConfigModel(BaseModel):
     """Pydantic model for developer configuration."""
 
@@ -241,8 +254,7 @@ class ScenarioConfig(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Scenario file not found: {file_path}")
 
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml_cached(str(path.resolve()), path.stat().st_mtime_ns)
 
         return cls(**data)
 
@@ -282,6 +294,8 @@ class ScenarioConfig(BaseModel):
         if not YAML_AVAILABLE:
             raise ImportError("PyYAML is required for YAML support. Install with: pip install pyyaml")
 
+        import yaml
+
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
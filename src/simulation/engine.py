@@ -8,16 +8,21 @@ Enhanced simulation engine with SDLC-specific orchestration:
 - Metrics collection
 """
 
-import random
 from typing import List, Optional, Dict, Any
 
-from .base import Simulation, SimulationContext
+import numpy as np
+
+from .base import Agent, Simulation, SimulationContext
 from .agents.developer import Developer
 from .agents.ai_agent import AIAgent
 from .models.types import PRState, CommunicationOverheadModel
 from .models.work import PullRequest, CodeReview, Incident
 from .models.technical_debt import TechnicalDebtTracker
 
+# PR states checked every step; enum members are compared by identity
+_OPEN = PRState.OPEN
+_APPROVED = PRState.APPROVED
+
 
 class SDLCSimulation(Simulation):
     """
@@ -36,7 +41,8 @@ class SDLCSimulation(Simulation):
         timestep_days: int = 1,
         random_seed: Optional[int] = None,
         communication_loss_factor: float = 0.3,
-        communication_overhead_model: CommunicationOverheadModel = CommunicationOverheadModel.QUADRATIC
+        communication_overhead_model: CommunicationOverheadModel = CommunicationOverheadModel.QUADRATIC,
+        log_events: bool = True
     ):
         """
         Initialize SDLC simulation.
@@ -47,11 +53,14 @@ class SDLCSimulation(Simulation):
             random_seed: Random seed for reproducibility
             communication_loss_factor: Information loss in team communication (0-1)
             communication_overhead_model: How overhead scales with team size
+            log_events: Record simulation events (metrics don't depend on them)
         """
-        super().__init__(name=name, timestep_days=timestep_days, random_seed=random_seed)
-
-        if random_seed is not None:
-            random.seed(random_seed)
+        super().__init__(
+            name=name,
+            timestep_days=timestep_days,
+            random_seed=random_seed,
+            log_events=log_events
+        )
 
         # Communication parameters
         self.communication_loss_factor = communication_loss_factor
@@ -65,6 +74,18 @@ class SDLCSimulation(Simulation):
 
         self.all_reviews: List[CodeReview] = []
 
+        # Reviews still in progress, and completed approvals grouped by PR ID,
+        # so merge processing doesn't rescan the whole review history
+        self._incomplete_reviews: List[CodeReview] = []
+        self._pr_approvals: Dict[int, List[CodeReview]] = {}
+
+        # Developer lookup by agent ID and rosters by agent kind, kept in
+        # sync by add_agent/remove_agent/reset
+        self._developers_by_id: Dict[str, Developer] = {}
+        self._developers: List[Developer] = []
+        self._human_developers: List[Developer] = []
+        self._ai_agents: List[AIAgent] = []
+
         # Technical debt
         self.tech_debt = TechnicalDebtTracker()
 
@@ -80,18 +101,55 @@ class SDLCSimulation(Simulation):
     @property
     def developers(self) -> List[Developer]:
         """Get all Developer agents in the simulation (includes both human and AI)."""
-        return [agent for agent in self.agents if isinstance(agent, Developer)]
+        return list(self._developers)
 
     @property
     def human_developers(self) -> List[Developer]:
         """Get only human Developer agents (excludes AI agents)."""
-        return [agent for agent in self.agents
-                if isinstance(agent, Developer) and not isinstance(agent, AIAgent)]
+        return list(self._human_developers)
 
     @property
     def ai_agents(self) -> List[AIAgent]:
         """Get only AI Agent agents."""
-        return [agent for agent in self.agents if isinstance(agent, AIAgent)]
+        return list(self._ai_agents)
+
+    def add_agent(self, agent: Agent) -> None:
+        """
+        Add an agent to the simulation, indexing developers by ID and kind.
+
+        Args:
+            agent: Agent to add
+        """
+        super().add_agent(agent)
+        if isinstance(agent, Developer):
+            self._developers_by_id.setdefault(agent.agent_id, agent)
+            self._developers.append(agent)
+            if isinstance(agent, AIAgent):
+                self._ai_agents.append(agent)
+            else:
+                self._human_developers.append(agent)
+
+    def remove_agent(self, agent: Agent) -> None:
+        """
+        Remove an agent from the simulation and the developer indexes.
+
+        Args:
+            agent: Agent to remove
+        """
+        super().remove_agent(agent)
+        if self._developers_by_id.get(agent.agent_id) is agent:
+            del self._developers_by_id[agent.agent_id]
+        for roster in (self._developers, self._human_developers, self._ai_agents):
+            if agent in roster:
+                roster.remove(agent)
+
+    def reset(self) -> None:
+        """Reset the simulation to initial state."""
+        super().reset()
+        self._developers_by_id.clear()
+        self._developers.clear()
+        self._human_developers.clear()
+        self._ai_agents.clear()
 
     def add_developer(self, developer: Developer) -> None:
         """
@@ -166,11 +224,18 @@ class SDLCSimulation(Simulation):
         Uses a simple round-robin approach for now.
         Future: Could be weighted by expertise, availability, etc.
         """
-        # Find PRs that need reviewers
+        # Find PRs that need reviewers. Only PRs still in open_prs can be in
+        # the OPEN state, so there is no need to scan the full PR history.
         prs_needing_review = [
-            pr for pr in self.all_prs
-            if pr.state == PRState.OPEN and len(pr.reviewers) < pr.required_approvals
+            pr for pr in self.open_prs
+            if pr.state is _OPEN and len(pr.reviewers) < pr.required_approvals
         ]
+        if not prs_needing_review:
+            return
+
+        # Reviewer pools are fixed for the duration of the step
+        human_developers = self._human_developers
+        developers = self._developers
 
         for pr in prs_needing_review:
             # Find PR author
@@ -185,13 +250,13 @@ class SDLCSimulation(Simulation):
             if is_ai_pr:
                 # AI PRs can only be reviewed by humans
                 available_reviewers = [
-                    dev for dev in self.human_developers
+                    dev for dev in human_developers
                     if dev.agent_id != pr.author_id and dev.agent_id not in pr.reviewers
                 ]
             else:
                 # Human PRs can be reviewed by anyone capable
                 available_reviewers = [
-                    dev for dev in self.developers
+                    dev for dev in developers
                     if dev.agent_id != pr.author_id
                     and dev.agent_id not in pr.reviewers
                     and (
@@ -205,9 +270,10 @@ class SDLCSimulation(Simulation):
 
             # Assign a random reviewer
             # TODO: Make this smarter (expertise matching, load balancing, etc.)
-            reviewer = random.choice(available_reviewers)
+            reviewer = self.rng.choice(available_reviewers)
             review = reviewer.assign_review(pr, context)
             self.all_reviews.append(review)
+            self._incomplete_reviews.append(review)
 
             pr.start_review()
 
@@ -226,33 +292,35 @@ class SDLCSimulation(Simulation):
         """
         Merge PRs that have received sufficient approvals.
         """
-        # Find completed reviews
-        completed_reviews = [r for r in self.all_reviews if r.is_complete and r.approved]
-
-        # Group by PR
-        pr_approvals: Dict[str, List[CodeReview]] = {}
-        for review in completed_reviews:
-            if review.pr_id not in pr_approvals:
-                pr_approvals[review.pr_id] = []
-            pr_approvals[review.pr_id].append(review)
+        # Group reviews completed since the last step by PR. A review is
+        # completed once, so only in-progress reviews need checking.
+        pr_approvals = self._pr_approvals
+        in_progress = []
+        for review in self._incomplete_reviews:
+            if not review.is_complete:
+                in_progress.append(review)
+            elif review.approved:
+                pr_approvals.setdefault(review.pr_id, []).append(review)
+        self._incomplete_reviews = in_progress
 
         # Merge PRs with enough approvals
         for pr in self.open_prs[:]:  # Copy list to avoid modification during iteration
-            if pr.pr_id in pr_approvals:
-                reviews = pr_approvals[pr.pr_id]
+            reviews = pr_approvals.get(pr.pr_id)
+            if reviews is not None:
 
                 # Add approvals
                 for review in reviews:
                     pr.add_approval(review.reviewer_id)
 
                 # Merge if approved
-                if pr.state == PRState.APPROVED:
+                if pr.state is _APPROVED:
                     author = self._get_developer_by_id(pr.author_id)
                     if author:
                         author.merge_pr(pr, context)
 
                         self.open_prs.remove(pr)
                         self.merged_prs.append(pr)
+                        del pr_approvals[pr.pr_id]
 
                         self.log_event(
                             event_type="pr_merged",
@@ -272,7 +340,7 @@ class SDLCSimulation(Simulation):
         recent_cutoff = max(0, context.current_day - 7)
 
         at_risk_prs = [
-            pr for pr in self.merged_prs
+            pr for pr in _since(self.merged_prs, 'merged_at', recent_cutoff)
             if pr.merged_at and pr.merged_at >= recent_cutoff
             and not pr.will_succeed
             and not pr.was_reverted
@@ -280,7 +348,7 @@ class SDLCSimulation(Simulation):
 
         for pr in at_risk_prs:
             # Random chance of discovering the issue each day
-            if random.random() < 0.1:  # 10% chance per day
+            if self.rng.random() < 0.1:  # 10% chance per day
                 author = self._get_developer_by_id(pr.author_id)
                 if author:
                     author.revert_pr(pr, context)
@@ -296,10 +364,7 @@ class SDLCSimulation(Simulation):
 
     def _get_developer_by_id(self, agent_id: str) -> Optional[Developer]:
         """Find a developer by their agent ID."""
-        for dev in self.developers:
-            if dev.agent_id == agent_id:
-                return dev
-        return None
+        return self._developers_by_id.get(agent_id)
 
     def _generate_technical_debt(self, context: SimulationContext) -> None:
         """
@@ -314,14 +379,14 @@ class SDLCSimulation(Simulation):
         recent_cutoff = max(0, context.current_day - 7)
 
         recent_prs = [
-            pr for pr in self.merged_prs
+            pr for pr in _since(self.merged_prs, 'merged_at', recent_cutoff)
             if pr.merged_at and pr.merged_at >= recent_cutoff
             and not pr.was_reverted
         ]
 
         for pr in recent_prs:
             # PRs that won't succeed might create tech debt instead of being reverted
-            if not pr.will_succeed and random.random() < self.tech_debt_accumulation_rate:
+            if not pr.will_succeed and self.rng.random() < self.tech_debt_accumulation_rate:
                 # Determine severity based on quality
                 # Lower quality = higher severity debt
                 author = self._get_developer_by_id(pr.author_id)
@@ -362,7 +427,7 @@ class SDLCSimulation(Simulation):
 
         # Adjust for recent quality issues
         recent_reverts = len([
-            pr for pr in self.reverted_prs
+            pr for pr in _since(self.reverted_prs, 'reverted_at', context.current_day - 7)
             if pr.reverted_at and pr.reverted_at >= context.current_day - 7
         ])
         quality_multiplier = 1.0 + (recent_reverts * 0.1)
@@ -371,10 +436,10 @@ class SDLCSimulation(Simulation):
         incident_probability = daily_incident_rate * debt_multiplier * quality_multiplier
 
         # Each developer has a chance to trigger an incident
-        for dev in self.developers:
-            if random.random() < incident_probability:
+        for dev in self._developers:
+            if self.rng.random() < incident_probability:
                 # Create incident
-                severity_roll = random.random()
+                severity_roll = self.rng.random()
                 if severity_roll < 0.1:
                     severity = "critical"
                     estimated_hours = 16.0
@@ -397,10 +462,10 @@ class SDLCSimulation(Simulation):
                 # Assign to a random developer (or multiple for critical)
                 if severity == "critical":
                     # Assign to 2-3 developers for critical incidents
-                    num_assignees = min(len(self.developers), random.randint(2, 3))
-                    assignees = random.sample(self.developers, num_assignees)
+                    num_assignees = min(len(self._developers), self.rng.randint(2, 3))
+                    assignees = self.rng.sample(self._developers, num_assignees)
                 else:
-                    assignees = [random.choice(self.developers)]
+                    assignees = [self.rng.choice(self._developers)]
 
                 for assignee in assignees:
                     incident.assign(assignee.agent_id)
@@ -456,44 +521,46 @@ class SDLCSimulation(Simulation):
         Returns:
             Dictionary of metrics
         """
-        total_devs = len(self.developers)
-        human_count = len(self.human_developers)
-        ai_count = len(self.ai_agents)
+        total_devs = len(self._developers)
+        human_count = len(self._human_developers)
+        ai_count = len(self._ai_agents)
 
         total_prs = len(self.all_prs)
         merged_count = len(self.merged_prs)
         reverted_count = len(self.reverted_prs)
 
-        # Separate AI vs human PRs
-        ai_prs = [pr for pr in self.all_prs if pr.metadata.get('created_by_ai', False)]
-        human_prs = [pr for pr in self.all_prs if not pr.metadata.get('created_by_ai', False)]
-
-        ai_merged = [pr for pr in self.merged_prs if pr.metadata.get('created_by_ai', False)]
-        human_merged = [pr for pr in self.merged_prs if not pr.metadata.get('created_by_ai', False)]
-
-        ai_reverted = [pr for pr in self.reverted_prs if pr.metadata.get('created_by_ai', False)]
-        human_reverted = [pr for pr in self.reverted_prs if not pr.metadata.get('created_by_ai', False)]
+        # Separate AI vs human PRs with boolean masks (one pass per PR list)
+        ai_created = int(np.count_nonzero(_ai_mask(self.all_prs)))
+        human_created = total_prs - ai_created
 
-        # Calculate average cycle time
-        cycle_times = [pr.cycle_time for pr in self.merged_prs if pr.cycle_time is not None]
-        avg_cycle_time = sum(cycle_times) / len(cycle_times) if cycle_times else 0
+        merged_is_ai = _ai_mask(self.merged_prs)
+        ai_merged = int(np.count_nonzero(merged_is_ai))
+        human_merged = merged_count - ai_merged
 
-        ai_cycle_times = [pr.cycle_time for pr in ai_merged if pr.cycle_time is not None]
-        avg_ai_cycle_time = sum(ai_cycle_times) / len(ai_cycle_times) if ai_cycle_times else 0
+        ai_reverted = int(np.count_nonzero(_ai_mask(self.reverted_prs)))
+        human_reverted = reverted_count - ai_reverted
 
-        human_cycle_times = [pr.cycle_time for pr in human_merged if pr.cycle_time is not None]
-        avg_human_cycle_time = sum(human_cycle_times) / len(human_cycle_times) if human_cycle_times else 0
+        # Calculate average cycle time (NaN marks PRs without a cycle time)
+        cycle_times = np.fromiter(
+            (np.nan if (ct := pr.cycle_time) is None else ct for pr in self.merged_prs),
+            dtype=float,
+            count=merged_count,
+        )
+        has_cycle_time = ~np.isnan(cycle_times)
+        avg_cycle_time = _mean(cycle_times[has_cycle_time])
+        avg_ai_cycle_time = _mean(cycle_times[has_cycle_time & merged_is_ai])
+        avg_human_cycle_time = _mean(cycle_times[has_cycle_time & ~merged_is_ai])
 
         # Calculate change failure rate
         change_failure_rate = reverted_count / merged_count if merged_count > 0 else 0
-        ai_failure_rate = len(ai_reverted) / len(ai_merged) if ai_merged else 0
-        human_failure_rate = len(human_reverted) / len(human_merged) if human_merged else 0
+        ai_failure_rate = ai_reverted / ai_merged if ai_merged else 0
+        human_failure_rate = human_reverted / human_merged if human_merged else 0
 
         # Calculate throughput (PRs per week)
         weeks = max(1, self.current_timestep // 7)
         prs_per_week = merged_count / weeks
-        ai_prs_per_week = len(ai_merged) / weeks
-        human_prs_per_week = len(human_merged) / weeks
+        ai_prs_per_week = ai_merged / weeks
+        human_prs_per_week = human_merged / weeks
 
         # Calculate communication overhead
         comm_overhead = self.calculate_communication_overhead(total_devs)
@@ -509,8 +576,8 @@ class SDLCSimulation(Simulation):
         avg_mttr = sum(mttr_values) / len(mttr_values) if mttr_values else 0
 
         # AI-specific metrics
-        total_ai_cost = sum(agent.total_cost_incurred for agent in self.ai_agents)
-        avg_ai_cost_per_pr = total_ai_cost / len(ai_prs) if ai_prs else 0
+        total_ai_cost = sum(agent.total_cost_incurred for agent in self._ai_agents)
+        avg_ai_cost_per_pr = total_ai_cost / ai_created if ai_created else 0
 
         return {
             "current_day": self.current_timestep,
@@ -529,16 +596,16 @@ class SDLCSimulation(Simulation):
             "prs_per_week": round(prs_per_week, 2),
             "communication_overhead": round(comm_overhead, 2),
             # Human-specific metrics
-            "human_prs_created": len(human_prs),
-            "human_prs_merged": len(human_merged),
-            "human_prs_reverted": len(human_reverted),
+            "human_prs_created": human_created,
+            "human_prs_merged": human_merged,
+            "human_prs_reverted": human_reverted,
             "human_failure_rate": round(human_failure_rate, 3),
             "human_prs_per_week": round(human_prs_per_week, 2),
             "human_avg_cycle_time_days": round(avg_human_cycle_time, 2),
             # AI-specific metrics
-            "ai_prs_created": len(ai_prs),
-            "ai_prs_merged": len(ai_merged),
-            "ai_prs_reverted": len(ai_reverted),
+            "ai_prs_created": ai_created,
+            "ai_prs_merged": ai_merged,
+            "ai_prs_reverted": ai_reverted,
             "ai_failure_rate": round(ai_failure_rate, 3),
             "ai_prs_per_week": round(ai_prs_per_week, 2),
             "ai_avg_cycle_time_days": round(avg_ai_cycle_time, 2),
@@ -556,9 +623,15 @@ class SDLCSimulation(Simulation):
             "avg_mttr_days": round(avg_mttr, 2),
         }
 
-    def print_summary(self) -> None:
-        """Print a summary of the simulation state."""
-        metrics = self.get_metrics()
+    def print_summary(self, metrics: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Print a summary of the simulation state.
+
+        Args:
+            metrics: Metrics from get_metrics(). Computed if not provided.
+        """
+        if metrics is None:
+            metrics = self.get_metrics()
 
         print(f"\n{'='*70}")
         print(f"Simulation: {self.name}")
@@ -621,3 +694,30 @@ class SDLCSimulation(Simulation):
             agent_id=pr.author_id,
             data={"pr_id": pr.pr_id}
         )
+
+
+def _since(prs: List[PullRequest], attr: str, cutoff: int) -> List[PullRequest]:
+    """
+    Trailing PRs whose timestamp attribute is at or after cutoff.
+
+    merged_prs and reverted_prs are appended in merge/revert order, so the
+    recent PRs sit at the end and the walk stops at the first older one.
+    """
+    start = len(prs)
+    while start and getattr(prs[start - 1], attr) >= cutoff:
+        start -= 1
+    return prs[start:]
+
+
+def _ai_mask(prs: List[PullRequest]) -> np.ndarray:
+    """Boolean mask marking which PRs were created by AI agents."""
+    return np.fromiter(
+        (pr.metadata.get('created_by_ai', False) for pr in prs),
+        dtype=bool,
+        count=len(prs),
+    )
+
+
+def _mean(values: np.ndarray) -> float:
+    """Mean of an array, or 0 if it is empty."""
+    return float(values.mean()) if values.size else 0
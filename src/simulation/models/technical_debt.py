@@ -22,7 +22,7 @@ class TechnicalDebtItem:
     """
     debt_id: str = ""
     created_at: int = 0
-    caused_by_pr: Optional[str] = None
+    caused_by_pr: Optional[int] = None
     severity: float = 1.0  # 0.5 = minor, 1.0 = moderate, 2.0 = severe
 
     # Impact on productivity
@@ -60,7 +60,7 @@ class TechnicalDebtTracker:
     def add_debt(
         self,
         created_at: int,
-        caused_by_pr: Optional[str] = None,
+        caused_by_pr: Optional[int] = None,
         severity: float = 1.0
     ) -> TechnicalDebtItem:
         """
@@ -20,14 +20,17 @@ class ExperienceLevel(Enum):
 
         These are defaults and can be overridden in agent configuration.
         """
-        multipliers = {
-            ExperienceLevel.JUNIOR: 0.5,
-            ExperienceLevel.MID: 1.0,
-            ExperienceLevel.SENIOR: 1.3,
-            ExperienceLevel.STAFF: 1.5,
-            ExperienceLevel.PRINCIPAL: 1.7,
-        }
-        return multipliers[self]
+        return _MULTIPLIER_TABLE[self]
+
+
+# Built once rather than on every multiplier lookup (read each step per developer)
+_MULTIPLIER_TABLE = {
+    ExperienceLevel.JUNIOR: 0.5,
+    ExperienceLevel.MID: 1.0,
+    ExperienceLevel.SENIOR: 1.3,
+    ExperienceLevel.STAFF: 1.5,
+    ExperienceLevel.PRINCIPAL: 1.7,
+}
 
 
 class PRState(Enum):
@@ -2,21 +2,54 @@
 Work-related models: Pull Requests, Reviews, Incidents, etc.
 """
 
+import itertools
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
-from uuid import uuid4
+from typing import Optional, List, Dict, Any, Set
+from uuid import UUID, uuid4
 
 from .types import PRState
 
+# PR states bound at module scope for the per-step hot paths; members are
+# singletons, so state checks can compare by identity.
+_OPEN = PRState.OPEN
+_IN_REVIEW = PRState.IN_REVIEW
+_APPROVED = PRState.APPROVED
+_MERGED = PRState.MERGED
+_REVERTED = PRState.REVERTED
+_CLOSED = PRState.CLOSED
 
-@dataclass
+# Work item IDs are plain integers drawn from a single process-wide counter.
+# Generating a uuid4 per object is comparatively expensive, and the UUID form
+# is only needed for exports, so it is derived on demand instead.
+_next_id = itertools.count(1).__next__
+_UUID_SALT = uuid4().int
+
+
+def work_item_uuid(item_id: int) -> UUID:
+    """
+    Derive the UUID for an integer work item ID.
+
+    The mapping is stable for the lifetime of the process.
+
+    Args:
+        item_id: Integer ID of a PR, review, or incident
+
+    Returns:
+        UUID for the work item
+    """
+    return UUID(int=_UUID_SALT ^ item_id)
+
+
+@dataclass(slots=True, eq=False)
 class PullRequest:
     """
     Represents a pull request in the simulation.
 
     PRs are the primary unit of work output in the SDLC simulation.
+    Each instance is a distinct piece of work, so PRs compare (and hash)
+    by identity rather than field by field.
     """
-    pr_id: str = field(default_factory=lambda: str(uuid4()))
+    pr_id: int = field(default_factory=_next_id)
     author_id: str = ""
     created_at: int = 0
     complexity: float = 1.0  # Relative complexity (1.0 = average)
@@ -26,7 +59,7 @@ class PullRequest:
 
     # Review process
     reviewers: List[str] = field(default_factory=list)
-    approvals: List[str] = field(default_factory=list)
+    approvals: Set[str] = field(default_factory=set)
     required_approvals: int = 1
 
     # Lifecycle timestamps
@@ -47,41 +80,44 @@ class PullRequest:
 
     def open(self, timestep: int) -> None:
         """Mark PR as open for review."""
-        self.state = PRState.OPEN
+        self.state = _OPEN
         self.opened_at = timestep
 
     def start_review(self) -> None:
         """Mark PR as in review."""
-        self.state = PRState.IN_REVIEW
+        self.state = _IN_REVIEW
 
     def add_approval(self, reviewer_id: str) -> None:
         """Add an approval from a reviewer."""
-        if reviewer_id not in self.approvals:
-            self.approvals.append(reviewer_id)
-
+        self.approvals.add(reviewer_id)
         if len(self.approvals) >= self.required_approvals:
-            self.state = PRState.APPROVED
+            self.state = _APPROVED
 
     def merge(self, timestep: int) -> None:
         """Merge the PR."""
-        self.state = PRState.MERGED
+        self.state = _MERGED
         self.merged_at = timestep
 
     def revert(self, timestep: int) -> None:
         """Revert the PR (quality issue found)."""
-        self.state = PRState.REVERTED
+        self.state = _REVERTED
         self.reverted_at = timestep
         self.was_reverted = True
 
     def close(self, timestep: int) -> None:
         """Close the PR without merging."""
-        self.state = PRState.CLOSED
+        self.state = _CLOSED
         self.closed_at = timestep
 
     @property
     def is_merged(self) -> bool:
         """Check if PR is merged."""
-        return self.state == PRState.MERGED
+        return self.state is _MERGED
+
+    @property
+    def pr_uuid(self) -> UUID:
+        """UUID form of pr_id (materialized on demand)."""
+        return work_item_uuid(self.pr_id)
 
     @property
     def cycle_time(self) -> Optional[int]:
@@ -96,18 +132,18 @@ class PullRequest:
         return None
 
     def __repr__(self) -> str:
-        return f"PR(id={self.pr_id[:8]}..., author={self.author_id[:8]}..., state={self.state.value})"
+        return f"PR(id={self.pr_id}, author={self.author_id[:8]}..., state={self.state.value})"
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeReview:
     """
     Represents a code review action.
 
     Reviews are performed by developers on PRs created by others.
     """
-    review_id: str = field(default_factory=lambda: str(uuid4()))
-    pr_id: str = ""
+    review_id: int = field(default_factory=_next_id)
+    pr_id: int = 0
     reviewer_id: str = ""
     started_at: int = 0
     completed_at: Optional[int] = None
@@ -124,11 +160,16 @@ class CodeReview:
         """Check if review is complete."""
         return self.completed_at is not None
 
+    @property
+    def review_uuid(self) -> UUID:
+        """UUID form of review_id (materialized on demand)."""
+        return work_item_uuid(self.review_id)
+
     def __repr__(self) -> str:
-        return f"Review(pr={self.pr_id[:8]}..., reviewer={self.reviewer_id[:8]}..., approved={self.approved})"
+        return f"Review(pr={self.pr_id}, reviewer={self.reviewer_id[:8]}..., approved={self.approved})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Incident:
     """
     Represents a production incident requiring developer attention.
@@ -136,7 +177,7 @@ class Incident:
     Incidents are random events that occur based on code quality and
     consume developer capacity.
     """
-    incident_id: str = field(default_factory=lambda: str(uuid4()))
+    incident_id: int = field(default_factory=_next_id)
     created_at: int = 0
     resolved_at: Optional[int] = None
     severity: str = "medium"  # low, medium, high, critical
@@ -149,7 +190,7 @@ class Incident:
     hours_invested: float = 0.0
 
     # Root cause (if known)
-    caused_by_pr: Optional[str] = None
+    caused_by_pr: Optional[int] = None
 
     def assign(self, developer_id: str) -> None:
         """Assign the incident to a developer."""
@@ -169,6 +210,11 @@ class Incident:
         """Check if incident is resolved."""
         return self.resolved_at is not None
 
+    @property
+    def incident_uuid(self) -> UUID:
+        """UUID form of incident_id (materialized on demand)."""
+        return work_item_uuid(self.incident_id)
+
     @property
     def time_to_resolve(self) -> Optional[int]:
         """
@@ -183,4 +229,4 @@ class Incident:
 
     def __repr__(self) -> str:
         status = "resolved" if self.is_resolved else "open"
-        return f"Incident(id={self.incident_id[:8]}..., severity={self.severity}, status={status})"
+        return f"Incident(id={self.incident_id}, severity={self.severity}, status={status})"
@@ -9,6 +9,20 @@ from .config import ScenarioConfig
 from .engine import SDLCSimulation
 from .agents.developer import Developer
 from .agents.ai_agent import AIAgent
+from .models.work import work_item_uuid
+from .serialization import dumps_json
+
+# Event data keys that hold integer work item IDs
+_WORK_ITEM_ID_KEYS = ("pr_id", "incident_id")
+
+
+def _export_event_data(data: dict) -> dict:
+    """Materialize integer work item IDs in event data as UUID strings."""
+    return {
+        key: str(work_item_uuid(value))
+        if key in _WORK_ITEM_ID_KEYS and isinstance(value, int) else value
+        for key, value in data.items()
+    }
 
 
 class ScenarioRunner:
@@ -18,14 +32,16 @@ class ScenarioRunner:
     Handles loading scenarios, creating simulations, and collecting results.
     """
 
-    def __init__(self, scenario: ScenarioConfig):
+    def __init__(self, scenario: ScenarioConfig, log_events: bool = True):
         """
         Initialize scenario runner.
 
         Args:
             scenario: Scenario configuration
+            log_events: Record simulation events (needed for exported event logs)
         """
         self.scenario = scenario
+        self.log_events = log_events
         self.simulation: Optional[SDLCSimulation] = None
 
     @classmethod
@@ -69,7 +85,8 @@ class ScenarioRunner:
             timestep_days=self.scenario.simulation.timestep_days,
             random_seed=self.scenario.simulation.random_seed,
             communication_loss_factor=self.scenario.simulation.communication_loss_factor,
-            communication_overhead_model=self.scenario.get_communication_overhead_model()
+            communication_overhead_model=self.scenario.get_communication_overhead_model(),
+            log_events=self.log_events
         )
 
         # Add human developers to the simulation
@@ -127,7 +144,7 @@ class ScenarioRunner:
             print("\n" + "="*80)
             print("Simulation Complete")
             print("="*80)
-            self.simulation.print_summary()
+            self.simulation.print_summary(metrics)
 
         return metrics
 
@@ -147,15 +164,16 @@ class ScenarioRunner:
         """
         Export simulation results to JSON.
 
+        Events are streamed to the file one at a time rather than being
+        collected into a list first, keeping memory flat for long runs.
+
         Args:
             output_path: Path to save results
         """
-        import json
-
         if self.simulation is None:
             raise RuntimeError("Simulation not run yet. Call run() first.")
 
-        results = {
+        summary = {
             "scenario": {
                 "name": self.scenario.name,
                 "description": self.scenario.description,
@@ -164,23 +182,26 @@ class ScenarioRunner:
             "configuration": self.scenario.model_dump(),
             "metrics": self.simulation.get_metrics(),
             "developers": self.get_developer_stats(),
-            "events": [
-                {
-                    "event_id": e.event_id,
-                    "event_type": e.event_type,
-                    "timestep": e.timestep,
-                    "agent_id": e.agent_id,
-                    "data": e.data
-                }
-                for e in self.simulation.events
-            ]
         }
 
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(path, 'wb') as f:
+            # Write the summary object without its closing brace, then
+            # append the events array entry by entry
+            f.write(dumps_json(summary, indent=True)[:-2])
+            f.write(b',\n  "events": [')
+            for i, e in enumerate(self.simulation.events):
+                f.write(b",\n    " if i else b"\n    ")
+                f.write(dumps_json({
+                    "event_id": e.event_id,
+                    "event_type": e.event_type,
+                    "timestep": e.timestep,
+                    "agent_id": e.agent_id,
+                    "data": _export_event_data(e.data)
+                }))
+            f.write(b"\n  ]\n}\n")
 
         print(f"\nResults exported to: {output_path}")
 
@@ -0,0 +1,142 @@
+"""
+Shared pytest fixtures.
+
+Finished simulations and loaded scenarios are expensive to produce and
+most tests only read them, so they are built once per session and shared.
+"""
+
+import os
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+import pytest
+
+from src.simulation.engine import SDLCSimulation
+from src.simulation.runner import ScenarioRunner
+from src.simulation.agents.developer import Developer, DeveloperConfig
+from src.simulation.agents.ai_agent import AIAgent, AIAgentConfig
+
+
+# Tests that run several seeded scenarios. Under pytest-xdist with
+# --dist loadgroup they share one worker, and so one set of session-scoped
+# simulation caches, while the remaining tests spread across the others
+_SIM_HEAVY_TESTS = ("run_all_multiple", "generate_insights", "winner_identification")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Tag simulation-heavy tests with an xdist group."""
+    for item in items:
+        if any(name in item.nodeid for name in _SIM_HEAVY_TESTS):
+            item.add_marker(pytest.mark.xdist_group("sim_heavy"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_metrics_cache():
+    """
+    Keep the on-disk metrics cache off regardless of the environment.
+
+    Cache hits would let determinism tests compare a run with itself. The
+    metrics_cache fixture turns it on for the tests that exercise it.
+    Session-scoped so it also covers session fixtures that run comparisons.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("SDLC_METRICS_CACHE", raising=False)
+        yield
+
+
+@pytest.fixture(scope="session")
+def finished_sim():
+    """
+    Factory for finished mixed-team simulations.
+
+    Each (n_human, n_ai, days, seed) combination is run once per session,
+    and its metrics are computed once alongside it. The returned simulation
+    and metrics are shared, so tests must not mutate them; use
+    ``copy.deepcopy`` if a test needs to.
+
+    Returns:
+        Callable taking (n_human, n_ai, days, seed=42) and returning a
+        (finished SDLCSimulation, metrics dict) tuple
+    """
+    cache = {}
+
+    def _get(n_human: int, n_ai: int, days: int, seed: int = 42) -> Tuple[SDLCSimulation, Dict[str, Any]]:
+        key = (n_human, n_ai, days, seed)
+        if key not in cache:
+            sim = SDLCSimulation(name=f"{n_human} Humans + {n_ai} AI", random_seed=seed)
+            for i in range(n_human):
+                sim.add_developer(Developer(config=DeveloperConfig(name=f"Human{i}")))
+            for i in range(n_ai):
+                sim.add_ai_agent(AIAgent(config=AIAgentConfig(name=f"AI{i}")))
+            sim.run(days)
+            cache[key] = (sim, sim.get_metrics())
+        return cache[key]
+
+    return _get
+
+
+def _partition_prs(sim: SDLCSimulation):
+    """Split a simulation's PRs into (ai, human) lists in one pass, cached on the sim."""
+    cached = getattr(sim, "_partition_cache", None)
+    if cached is not None and cached[0] == len(sim.all_prs):
+        return cached[1]
+
+    ai_prs, human_prs = [], []
+    for pr in sim.all_prs:
+        (ai_prs if pr.metadata.get('created_by_ai', False) else human_prs).append(pr)
+
+    sim._partition_cache = (len(sim.all_prs), (ai_prs, human_prs))
+    return ai_prs, human_prs
+
+
+@pytest.fixture(scope="session")
+def partition_prs():
+    """
+    Helper splitting a simulation's PRs into AI- and human-authored lists.
+
+    The split is cached on the simulation and recomputed if more PRs have
+    been created since.
+
+    Returns:
+        Callable taking an SDLCSimulation and returning (ai_prs, human_prs)
+    """
+    return _partition_prs
+
+
+@lru_cache(maxsize=None)
+def _load_runner(path: str) -> ScenarioRunner:
+    """Load a prototype runner for a scenario file once per session."""
+    return ScenarioRunner.from_yaml(path)
+
+
+@pytest.fixture(scope="session")
+def cached_runner():
+    """
+    Factory for shared scenario runners loaded from YAML.
+
+    Runners are shared between tests, so tests that run or modify one
+    must work on a ``copy.deepcopy`` of it.
+
+    Returns:
+        Callable taking a scenario file path and returning a ScenarioRunner
+    """
+    return _load_runner
+
+
+@pytest.fixture(scope="session")
+def sim_days():
+    """
+    Scale simulation lengths by the SDLC_TEST_DAYS_SCALE environment variable.
+
+    Long-running tests that only need a qualitative signal can be shortened,
+    e.g. ``SDLC_TEST_DAYS_SCALE=0.3 pytest tests/``. Defaults to no scaling.
+
+    Returns:
+        Callable mapping a default number of days to the scaled number (>= 1)
+    """
+    scale = float(os.environ.get("SDLC_TEST_DAYS_SCALE", "1.0"))
+
+    def _scale(default: int) -> int:
+        return max(1, int(default * scale))
+
+    return _scale
@@ -4,7 +4,7 @@ Integration tests for scenario comparison with real YAML files.
 
 import pytest
 from pathlib import Path
-from src.simulation.comparison import ScenarioComparison
+from src.simulation.comparison import ScenarioComparison, _run_seeded
 
 
 class TestScenarioComparisonIntegration:
@@ -235,11 +235,16 @@ class TestScenarioComparisonIntegration:
             "data/scenarios/comparison/balanced_mixed_team.yaml",
         ]
 
+        # Simulate both runs rather than reusing cached seeded results
+        _run_seeded.cache_clear()
+
         # Run first comparison
         comparison1 = ScenarioComparison(verbose=False)
         comparison1.add_scenarios(scenarios)
         results1 = comparison1.run_all()
 
+        _run_seeded.cache_clear()
+
         # Run second comparison
         comparison2 = ScenarioComparison(verbose=False)
         comparison2.add_scenarios(scenarios)
@@ -4,6 +4,9 @@ Integration tests for mixed human/AI team simulations.
 Tests the interaction between human developers and AI agents working together.
 """
 
+import copy
+
+import numpy as np
 import pytest
 from src.simulation.engine import SDLCSimulation
 from src.simulation.agents.developer import Developer, DeveloperConfig
@@ -12,6 +15,29 @@ from src.simulation.models.types import ExperienceLevel, AIModelType, PRState
 from src.simulation.runner import ScenarioRunner
 
 
+def _run_one(ai_count: int) -> dict:
+    """Run a 1-week simulation with 5 humans and ai_count AI agents."""
+    sim = SDLCSimulation(name=f"AI Count: {ai_count}", random_seed=42)
+
+    # Fixed human team
+    for i in range(5):
+        sim.add_developer(Developer(config=DeveloperConfig(name=f"Human{i}")))
+
+    # Variable AI team
+    for i in range(ai_count):
+        sim.add_ai_agent(AIAgent(config=AIAgentConfig(name=f"AI{i}")))
+
+    # Run short simulation
+    sim.run(7)  # 1 week
+
+    metrics = sim.get_metrics()
+    return {
+        'ai_count': ai_count,
+        'throughput': metrics['prs_per_week'],
+        'cost': metrics['ai_total_cost'],
+    }
+
+
 class TestMixedTeamSimulation:
     """Test simulations with both humans and AI agents."""
 
@@ -31,7 +57,24 @@ class TestMixedTeamSimulation:
         assert len(sim.human_developers) == 1
         assert len(sim.ai_agents) == 1
 
-    def test_human_only_review_of_ai_prs(self):
+    def test_rosters_follow_remove_and_reset(self):
+        """Test that developer rosters stay in sync as agents are removed."""
+        sim = SDLCSimulation(name="Roster Test", random_seed=42)
+        human = Developer(config=DeveloperConfig(name="Human"))
+        ai = AIAgent(config=AIAgentConfig(name="AI"))
+        sim.add_developer(human)
+        sim.add_ai_agent(ai)
+
+        sim.remove_agent(ai)
+        assert sim.developers == [human]
+        assert sim.human_developers == [human]
+        assert sim.ai_agents == []
+
+        sim.reset()
+        assert sim.developers == []
+        assert sim.human_developers == []
+
+    def test_human_only_review_of_ai_prs(self, partition_prs):
         """Test that AI PRs are only assigned to human reviewers."""
         sim = SDLCSimulation(name="Review Test", random_seed=42)
 
@@ -45,34 +88,24 @@ class TestMixedTeamSimulation:
         sim.add_ai_agent(ai)
 
         # Run a few steps to generate PRs
-        for _ in range(10):
-            sim.step()
+        sim.run(10)
 
         # Check that AI PRs only have human reviewers
-        ai_prs = [pr for pr in sim.all_prs if pr.metadata.get('created_by_ai', False)]
+        ai_prs, _ = partition_prs(sim)
+        human_ids = frozenset({human1.agent_id, human2.agent_id})
+        ai_id = ai.agent_id
 
         for pr in ai_prs:
-            if pr.reviewers:
-                for reviewer_id in pr.reviewers:
-                    # Reviewer should be one of the humans
-                    assert reviewer_id in [human1.agent_id, human2.agent_id]
-                    assert reviewer_id != ai.agent_id
+            # Reviewers should all be humans
+            assert set(pr.reviewers) <= human_ids
+            assert ai_id not in pr.reviewers
 
-    def test_mixed_team_produces_both_pr_types(self):
+    def test_mixed_team_produces_both_pr_types(self, finished_sim, partition_prs):
         """Test that mixed teams generate both human and AI PRs."""
-        sim = SDLCSimulation(name="PR Types Test", random_seed=42)
-
-        # Add balanced team
-        for i in range(2):
-            sim.add_developer(Developer(config=DeveloperConfig(name=f"Human{i}")))
-            sim.add_ai_agent(AIAgent(config=AIAgentConfig(name=f"AI{i}")))
-
-        # Run simulation
-        sim.run(14)  # 2 weeks
+        sim, _ = finished_sim(n_human=2, n_ai=2, days=14)  # 2 weeks
 
         # Should have both types of PRs
-        ai_prs = [pr for pr in sim.all_prs if pr.metadata.get('created_by_ai', False)]
-        human_prs = [pr for pr in sim.all_prs if not pr.metadata.get('created_by_ai', False)]
+        ai_prs, human_prs = partition_prs(sim)
 
         assert len(ai_prs) > 0, "Should have AI-generated PRs"
         assert len(human_prs) > 0, "Should have human-generated PRs"
@@ -105,18 +138,9 @@ class TestMixedTeamSimulation:
         if metrics['ai_prs_created'] > 0:
             assert metrics['ai_avg_cost_per_pr'] > 0
 
-    def test_metrics_separation(self):
+    def test_metrics_separation(self, finished_sim):
         """Test that metrics correctly separate human and AI contributions."""
-        sim = SDLCSimulation(name="Metrics Test", random_seed=42)
-
-        # Add team
-        sim.add_developer(Developer(config=DeveloperConfig(name="Human")))
-        sim.add_ai_agent(AIAgent(config=AIAgentConfig(name="AI")))
-
-        # Run simulation
-        sim.run(14)  # 2 weeks
-
-        metrics = sim.get_metrics()
+        _, metrics = finished_sim(n_human=1, n_ai=1, days=14)  # 2 weeks
 
         # Check composition metrics
         assert metrics['human_developers'] == 1
@@ -124,15 +148,63 @@ class TestMixedTeamSimulation:
         assert metrics['total_developers'] == 2
 
         # Check that metrics add up
-        assert metrics['total_prs_created'] == metrics['human_prs_created'] + metrics['ai_prs_created']
-        assert metrics['total_prs_merged'] == metrics['human_prs_merged'] + metrics['ai_prs_merged']
-        assert metrics['total_prs_reverted'] == metrics['human_prs_reverted'] + metrics['ai_prs_reverted']
+        stages = ['created', 'merged', 'reverted']
+        np.testing.assert_allclose(
+            [metrics[f'total_prs_{stage}'] for stage in stages],
+            [metrics[f'human_prs_{stage}'] + metrics[f'ai_prs_{stage}'] for stage in stages],
+        )
 
         # AI-specific metrics should exist
         assert 'ai_failure_rate' in metrics
         assert 'ai_prs_per_week' in metrics
         assert 'ai_total_cost' in metrics
 
+    def test_interleaved_simulations_are_independent(self):
+        """Test that stepping two seeded simulations in lockstep doesn't mix their RNGs."""
+        def build():
+            sim = SDLCSimulation(name="Interleaved", random_seed=42)
+            sim.add_developer(Developer(config=DeveloperConfig(name="Human")))
+            sim.add_ai_agent(AIAgent(config=AIAgentConfig(name="AI")))
+            return sim
+
+        solo = build()
+        solo.run(14)
+
+        sim_a, sim_b = build(), build()
+        for _ in range(14):
+            sim_a.step()
+            sim_b.step()
+
+        assert sim_a.get_metrics() == solo.get_metrics()
+        assert sim_b.get_metrics() == solo.get_metrics()
+
+    def test_event_logging_does_not_affect_metrics(self):
+        """Test that a run without event logging matches a logged run and records nothing."""
+        def build(log_events):
+            sim = SDLCSimulation(name="Logging", random_seed=42, log_events=log_events)
+            sim.add_developer(Developer(config=DeveloperConfig(name="Human")))
+            sim.add_ai_agent(AIAgent(config=AIAgentConfig(name="AI")))
+            sim.run(14)
+            return sim
+
+        logged, quiet = build(True), build(False)
+
+        assert logged.events
+        assert quiet.events == []
+        assert quiet.get_metrics() == logged.get_metrics()
+
+    def test_review_tracking_stays_bounded(self):
+        """Test that merge bookkeeping only holds in-progress reviews and open PRs."""
+        sim = SDLCSimulation(name="Review Tracking", random_seed=42, log_events=False)
+        for i in range(3):
+            sim.add_developer(Developer(config=DeveloperConfig(name=f"Human{i}")))
+        sim.run(28)
+
+        assert sim.merged_prs
+        assert all(not review.is_complete for review in sim._incomplete_reviews)
+        open_ids = {pr.pr_id for pr in sim.open_prs}
+        assert set(sim._pr_approvals) <= open_ids
+
     def test_ai_agents_have_no_onboarding(self):
         """Test that AI agents are productive immediately."""
         sim = SDLCSimulation(name="Onboarding Test", random_seed=42)
@@ -165,15 +237,12 @@ class TestMixedTeamSimulation:
         assert human.weeks_in_role == 1
         assert 0 < human.config.current_productivity_multiplier <= 0.2
 
-    def test_ai_24_7_availability(self):
+    def test_ai_24_7_availability(self, finished_sim):
         """Test that AI agents have continuous availability."""
-        sim = SDLCSimulation(name="Availability Test", random_seed=42)
+        sim, _ = finished_sim(n_human=1, n_ai=1, days=14)
 
-        ai = AIAgent(config=AIAgentConfig(name="AI"))
-        human = Developer(config=DeveloperConfig(name="Human"))
-
-        sim.add_ai_agent(ai)
-        sim.add_developer(human)
+        ai = sim.ai_agents[0]
+        human = sim.human_developers[0]
 
         # Check availability
         assert ai.config.availability == 1.0  # 24/7
@@ -186,41 +255,49 @@ class TestMixedTeamSimulation:
 class TestMixedTeamFromConfig:
     """Test loading mixed teams from configuration files."""
 
-    def test_load_mixed_team_yaml(self):
-        """Test loading a mixed team from YAML configuration."""
-        runner = ScenarioRunner.from_yaml('data/scenarios/mixed_team_example.yaml')
+    @pytest.mark.parametrize("path,name,n_humans,n_ai,models", [
+        # Explicit team: 5 humans + 3 Claude Sonnet and 1 CodeLlama agents
+        ("data/scenarios/mixed_team_example.yaml", "Mixed Team: 5 Humans + 4 AI Agents",
+         5, 4, {AIModelType.CLAUDE_SONNET, AIModelType.CODELLAMA}),
+        # Quick generation: 7 humans (2 senior, 4 mid, 1 junior) + 6 default (Sonnet) agents
+        ("data/scenarios/quick_mixed_team.yaml", "Quick Mixed Team: Auto-Generated",
+         7, 6, {AIModelType.CLAUDE_SONNET}),
+    ])
+    def test_yaml_team_composition(self, cached_runner, path, name, n_humans, n_ai, models):
+        """Test loading mixed team composition from YAML configuration."""
+        runner = cached_runner(path)
 
-        assert runner.scenario.name == "Mixed Team: 5 Humans + 4 AI Agents"
+        assert runner.scenario.name == name
 
-        # Check team composition
         humans = runner.scenario.team.get_developers()
         ai_agents = runner.scenario.team.get_ai_agents()
 
-        assert len(humans) == 5
-        assert len(ai_agents) == 4
+        assert len(humans) == n_humans
+        assert len(ai_agents) == n_ai
+        assert {ai.model_type for ai in ai_agents} == models
 
-        # Check AI agent types
-        ai_models = [ai.model_type for ai in ai_agents]
-        assert AIModelType.CLAUDE_SONNET in ai_models
-        assert AIModelType.CODELLAMA in ai_models
+    def test_yaml_reloaded_after_edit(self, tmp_path):
+        """Test that editing a scenario file invalidates the parse cache."""
+        import os
 
-    def test_quick_generation_yaml(self):
-        """Test quick team generation from YAML."""
-        runner = ScenarioRunner.from_yaml('data/scenarios/quick_mixed_team.yaml')
+        scenario_file = tmp_path / "scenario.yaml"
+        scenario_file.write_text("name: Before\nteam:\n  count: 2\n")
+        assert ScenarioRunner.from_yaml(scenario_file).scenario.name == "Before"
 
-        humans = runner.scenario.team.get_developers()
-        ai_agents = runner.scenario.team.get_ai_agents()
-
-        # Quick config specified: 7 humans (2 senior, 4 mid, 1 junior) + 6 AI
-        assert len(humans) == 7
-        assert len(ai_agents) == 6
+        scenario_file.write_text("name: After\nteam:\n  count: 3\n")
+        stat = scenario_file.stat()
+        os.utime(scenario_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
 
-        # All AI agents should be claude-sonnet (default)
-        assert all(ai.model_type == AIModelType.CLAUDE_SONNET for ai in ai_agents)
+        runner = ScenarioRunner.from_yaml(scenario_file)
+        assert runner.scenario.name == "After"
+        assert runner.scenario.team.count == 3
 
-    def test_run_mixed_team_scenario(self):
+    @pytest.mark.slow
+    def test_run_mixed_team_scenario(self, cached_runner, sim_days):
         """Test running a complete mixed team scenario."""
-        runner = ScenarioRunner.from_yaml('data/scenarios/quick_mixed_team.yaml')
+        runner = copy.deepcopy(cached_runner('data/scenarios/quick_mixed_team.yaml'))
+        weeks = runner.scenario.simulation.duration_weeks
+        runner.scenario.simulation.duration_weeks = max(1, sim_days(weeks * 7) // 7)
 
         # Run simulation (short duration for test)
         metrics = runner.run(verbose=False)
@@ -235,34 +312,58 @@ class TestMixedTeamFromConfig:
         assert metrics['ai_prs_created'] >= 0
         assert metrics['ai_total_cost'] >= 0
 
+    def test_export_results(self, cached_runner, tmp_path):
+        """Test that exported results are valid JSON including all events."""
+        import json
 
-class TestDiminishingReturns:
-    """Test scenarios to identify diminishing returns with AI agents."""
+        runner = copy.deepcopy(cached_runner('data/scenarios/quick_mixed_team.yaml'))
+        runner.scenario.simulation.duration_weeks = 1
+        runner.run(verbose=False)
 
-    def test_increasing_ai_agents(self):
-        """Test that adding AI agents shows pattern of returns."""
-        results = []
+        output_file = tmp_path / "results.json"
+        runner.export_results(output_file)
+
+        with open(output_file) as f:
+            data = json.load(f)
+
+        assert data['scenario']['name'] == runner.scenario.name
+        assert data['metrics'] == runner.simulation.get_metrics()
+        assert len(data['developers']) == len(runner.simulation.developers)
+        assert len(data['events']) == len(runner.simulation.events)
+
+        # Integer work item IDs are exported as UUID strings
+        pr_events = [e for e in data['events'] if e['event_type'] == 'pr_created']
+        assert pr_events
+        assert {type(e['data']['pr_id']) for e in pr_events} == {str}
+
+    def test_export_reflects_scenario_changes(self, cached_runner, tmp_path):
+        """Test that each export uses the scenario as it is at export time."""
+        import json
+
+        runner = copy.deepcopy(cached_runner('data/scenarios/quick_mixed_team.yaml'))
+        runner.scenario.simulation.duration_weeks = 1
+        runner.run(verbose=False)
+        runner.export_results(tmp_path / "first.json")
 
-        for ai_count in [0, 2, 4, 6, 8]:
-            sim = SDLCSimulation(name=f"AI Count: {ai_count}", random_seed=42)
+        runner.scenario.simulation.duration_weeks = 3
+        runner.run(verbose=False)
+        runner.export_results(tmp_path / "second.json")
 
-            # Fixed human team
-            for i in range(5):
-                sim.add_developer(Developer(config=DeveloperConfig(name=f"Human{i}")))
+        with open(tmp_path / "second.json") as f:
+            data = json.load(f)
 
-            # Variable AI team
-            for i in range(ai_count):
-                sim.add_ai_agent(AIAgent(config=AIAgentConfig(name=f"AI{i}")))
+        assert data['configuration']['simulation']['duration_weeks'] == 3
 
-            # Run short simulation
-            sim.run(7)  # 1 week
 
-            metrics = sim.get_metrics()
-            results.append({
-                'ai_count': ai_count,
-                'throughput': metrics['prs_per_week'],
-                'cost': metrics['ai_total_cost'],
-            })
+class TestDiminishingReturns:
+    """Test scenarios to identify diminishing returns with AI agents."""
+
+    @pytest.mark.slow
+    def test_increasing_ai_agents(self):
+        """Test that adding AI agents shows pattern of returns."""
+        ai_counts = [0, 2, 4, 6, 8]
+
+        results = [_run_one(ai_count) for ai_count in ai_counts]
 
         # Throughput should increase with AI agents
         throughputs = [r['throughput'] for r in results]
@@ -272,7 +373,8 @@ class TestDiminishingReturns:
         costs = [r['cost'] for r in results[1:]]  # Skip 0 AI
         assert all(costs[i] > costs[i-1] for i in range(1, len(costs))), "Costs should increase with AI count"
 
-    def test_human_review_bottleneck(self):
+    @pytest.mark.slow
+    def test_human_review_bottleneck(self, sim_days):
         """Test that human review can become a bottleneck with many AI agents."""
         sim = SDLCSimulation(name="Bottleneck Test", random_seed=42)
 
@@ -285,7 +387,7 @@ class TestDiminishingReturns:
             sim.add_ai_agent(AIAgent(config=AIAgentConfig(name=f"AI{i}")))
 
         # Run simulation
-        sim.run(14)  # 2 weeks
+        sim.run(sim_days(14))  # 2 weeks
 
         # Should have many open PRs (bottleneck indicator)
         metrics = sim.get_metrics()
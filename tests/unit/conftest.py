@@ -0,0 +1,142 @@
+"""
+Unit test fixtures for scenario comparison.
+
+A canonical single-scenario comparison is run once per session for tests
+that only read or export its results.
+
+Seeded simulations are deterministic, and a run of N weeks passes through
+the same states as every shorter run of the same team. Finished weeks are
+snapshotted so scenarios sharing a prefix only simulate the remaining days.
+"""
+
+import json
+import pickle
+from typing import Dict, List
+
+import pytest
+
+from src.simulation.comparison import _LABEL_FIELDS, ScenarioComparison, ScenarioResult, _run_seeded
+from src.simulation.config import ScenarioConfig, TeamConfigModel, SimulationConfigModel
+from src.simulation.runner import ScenarioRunner
+
+
+def _prefix_key(config: ScenarioConfig) -> str:
+    """Key everything that shapes a run except its length and labels."""
+    data = config.model_dump(exclude=_LABEL_FIELDS)
+    del data['simulation']['duration_weeks']
+    return json.dumps(data, sort_keys=True)
+
+
+class _SnapshotStore:
+    """Pickled simulation states keyed by (scenario prefix, completed weeks)."""
+
+    def __init__(self):
+        self.snapshots: Dict[str, Dict[int, bytes]] = {}
+
+    def run(self, config: ScenarioConfig) -> ScenarioResult:
+        """Run a scenario, resuming from the longest stored prefix."""
+        weeks = config.simulation.duration_weeks
+        runner = ScenarioRunner(config, log_events=False)
+
+        if config.simulation.random_seed is None:
+            # Unseeded runs aren't reproducible, so there is nothing to share
+            metrics = runner.run(verbose=False)
+        else:
+            stored = self.snapshots.setdefault(_prefix_key(config), {})
+            done = max((w for w in stored if w <= weeks), default=0)
+            sim = pickle.loads(stored[done]) if done else runner.setup()
+            sim.name = config.name
+
+            for week in range(done + 1, weeks + 1):
+                sim.run(7)
+                stored.setdefault(week, pickle.dumps(sim))
+            metrics = sim.get_metrics()
+
+        return ScenarioResult(
+            name=config.name,
+            description=config.description,
+            metrics=metrics,
+            config=config
+        )
+
+    def run_all(self, comparison: ScenarioComparison) -> List[ScenarioResult]:
+        """Drop-in for ScenarioComparison.run_all backed by the snapshot store."""
+        if not comparison.scenarios:
+            raise ValueError("No scenarios added. Use add_scenario() first.")
+
+        comparison.results = [self.run(config) for config in comparison.scenarios]
+        return comparison.results
+
+
+@pytest.fixture(scope="session")
+def scenario_factory():
+    """
+    Build scenario configs by copying one validated template.
+
+    The template is a 5-developer, 1-week, seed 42 scenario named "X".
+    Keyword arguments replace top-level fields via a deep model_copy, which
+    skips re-validation; each config gets its own sub-models, so tests may
+    modify them.
+
+    Returns:
+        Callable taking ScenarioConfig field overrides and returning a new config
+    """
+    base = ScenarioConfig(
+        name="X",
+        team=TeamConfigModel(count=5),
+        simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+    )
+    return lambda **kw: base.model_copy(update=kw, deep=True)
+
+
+@pytest.fixture(scope="session")
+def cached_scenario_runner():
+    """
+    Run a comparison's scenarios through a shared prefix snapshot store.
+
+    Only for tests that need results rather than the behaviour of run_all
+    itself.
+
+    Returns:
+        Callable taking a ScenarioComparison, filling in and returning its results
+    """
+    return _SnapshotStore().run_all
+
+
+@pytest.fixture(scope="session")
+def baseline_comparison():
+    """
+    Comparison of a single 5-developer, 1-week, seed 42 scenario, run once.
+
+    Shared across tests, so tests must not mutate it; deepcopy its results
+    if needed.
+
+    Returns:
+        ScenarioComparison with results
+    """
+    comparison = ScenarioComparison(verbose=False)
+    comparison.add_scenario(ScenarioConfig(
+        name="Baseline",
+        team=TeamConfigModel(count=5),
+        simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+    ))
+    comparison.run_all()
+    return comparison
+
+
+@pytest.fixture
+def metrics_cache(monkeypatch, tmp_path):
+    """
+    Enable the on-disk metrics cache in a temporary directory.
+
+    The in-memory seeded-run cache is cleared on entry and exit so results
+    actually go through the shelf.
+
+    Returns:
+        Directory holding the cache shelf
+    """
+    monkeypatch.setenv("SDLC_METRICS_CACHE", "1")
+    monkeypatch.setenv("SDLC_CACHE_DIR", str(tmp_path))
+    _run_seeded.cache_clear()
+    yield tmp_path
+    _run_seeded.cache_clear()
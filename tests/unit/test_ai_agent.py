@@ -9,11 +9,26 @@ Tests AI-specific behaviors including:
 - Model-specific defaults
 """
 
+import numpy as np
 import pytest
 from src.simulation.agents.ai_agent import AIAgent, AIAgentConfig
 from src.simulation.models.types import AIModelType
+from src.simulation.models.work import PullRequest
 from src.simulation.base import SimulationContext
 
+# Contexts are only read by agents, so tests share them
+CTX_DAY0 = SimulationContext(current_day=0, current_week=0)
+CTX_DAY1 = SimulationContext(current_day=1, current_week=0)
+
+# Cheapest, mid-range and most expensive models
+REPRESENTATIVE_MODELS = [AIModelType.CODELLAMA, AIModelType.CLAUDE_SONNET, AIModelType.CLAUDE_OPUS]
+
+
+def _create_prs(agent, context, n):
+    """Create n PRs from an agent and return them."""
+    create_pr = agent.create_pr
+    return [create_pr(context) for _ in range(n)]
+
 
 class TestAIAgentConfig:
     """Test AIAgentConfig configuration and defaults."""
@@ -67,6 +82,15 @@ class TestAIAgentConfig:
         assert dev_config.communication_bandwidth == 50.0  # High scalability
 
 
+@pytest.fixture(scope="class")
+def shared_prs():
+    """Human and AI PRs built once per test class."""
+    return {
+        "human": PullRequest(author_id="human-1"),
+        "ai": PullRequest(author_id="ai-1", metadata={'created_by_ai': True}),
+    }
+
+
 class TestAIAgent:
     """Test AIAgent behavior and functionality."""
 
@@ -83,14 +107,13 @@ class TestAIAgent:
     def test_no_onboarding_required(self):
         """Test that AI agents don't need onboarding."""
         agent = AIAgent()
-        context = SimulationContext(current_day=0, current_week=0)
 
         # Should be ready immediately
         assert agent.is_fully_onboarded is True
         assert agent.config.current_productivity_multiplier == 1.0
 
         # Onboarding update should not change anything
-        agent._update_onboarding(context)
+        agent._update_onboarding(CTX_DAY0)
         assert agent.is_fully_onboarded is True
         assert agent.config.current_productivity_multiplier == 1.0
 
@@ -98,10 +121,9 @@ class TestAIAgent:
         """Test that creating PRs tracks costs."""
         config = AIAgentConfig(model_type=AIModelType.CLAUDE_SONNET)
         agent = AIAgent(config=config)
-        context = SimulationContext(current_day=1, current_week=0)
 
         initial_cost = agent.total_cost_incurred
-        pr = agent.create_pr(context)
+        pr = agent.create_pr(CTX_DAY1)
 
         # Cost should have increased
         assert agent.total_cost_incurred > initial_cost
@@ -116,30 +138,30 @@ class TestAIAgent:
         """Test that costs accumulate across multiple PRs."""
         config = AIAgentConfig(cost_per_pr=0.50)
         agent = AIAgent(config=config)
-        context = SimulationContext(current_day=1, current_week=0)
 
-        # Create 3 PRs
-        for _ in range(3):
-            agent.create_pr(context)
+        _create_prs(agent, CTX_DAY1, 3)
 
-        assert agent.total_cost_incurred == 1.50  # 3 * $0.50
+        assert agent.total_cost_incurred == pytest.approx(1.50)  # 3 * $0.50
         assert agent.total_prs_created == 3
 
-    def test_can_review_pr_rules(self):
+    @pytest.fixture
+    def prs(self, shared_prs):
+        """Shared PRs, with their metadata restored after each test."""
+        yield shared_prs
+        shared_prs["human"].metadata = {}
+        shared_prs["ai"].metadata = {'created_by_ai': True}
+
+    def test_can_review_pr_rules(self, prs):
         """Test AI agent review permission logic."""
         agent = AIAgent(config=AIAgentConfig(
             can_review_human_prs=False,
             can_review_ai_prs=False
         ))
 
-        # Create a human PR (no metadata)
-        from src.simulation.models.work import PullRequest
-        human_pr = PullRequest(author_id="human-1")
+        # Human PR (no metadata) and AI PR
+        human_pr = prs["human"]
+        ai_pr = prs["ai"]
         assert agent.can_review_pr(human_pr) is False
-
-        # Create an AI PR
-        ai_pr = PullRequest(author_id="ai-1")
-        ai_pr.metadata = {'created_by_ai': True}
         assert agent.can_review_pr(ai_pr) is False
 
         # Update config to allow AI reviews
@@ -151,9 +173,8 @@ class TestAIAgent:
         """Test calculation of human review hours needed."""
         config = AIAgentConfig(supervision_requirement=0.25)
         agent = AIAgent(config=config)
-        context = SimulationContext(current_day=1, current_week=0)
 
-        pr = agent.create_pr(context)
+        pr = agent.create_pr(CTX_DAY1)
         hours = agent.get_supervision_hours_for_pr(pr)
 
         # Base review time (2 hrs) * supervision requirement (0.25) = 0.5 hrs
@@ -167,10 +188,9 @@ class TestAIAgent:
             cost_per_pr=0.80
         )
         agent = AIAgent(config=config)
-        context = SimulationContext(current_day=1, current_week=0)
 
         # Create a PR to accumulate some cost
-        agent.create_pr(context)
+        agent.create_pr(CTX_DAY1)
 
         stats = agent.get_stats()
 
@@ -201,37 +221,43 @@ class TestAIAgent:
 class TestAIModelTypes:
     """Test AI model type enum and its properties."""
 
-    def test_all_models_have_defaults(self):
-        """Test that all model types have complete defaults."""
-        for model in AIModelType:
-            assert model.default_productivity_rate > 0
-            assert 0 < model.default_code_quality <= 1.0
-            assert 0 <= model.default_supervision_requirement <= 1.0
-            assert model.default_cost_per_pr >= 0
-
-    def test_productivity_rates_realistic(self):
-        """Test that productivity rates are in realistic ranges."""
-        for model in AIModelType:
-            # AI agents work 24/7, so rates should be higher than humans (3.5 baseline)
-            # but not absurdly high
-            assert 5.0 <= model.default_productivity_rate <= 15.0
-
-    def test_code_quality_realistic(self):
-        """Test that code quality is in realistic ranges."""
-        for model in AIModelType:
-            # AI quality should be good but not perfect
-            # Lower than top human developers (0.95)
-            assert 0.75 <= model.default_code_quality <= 0.90
+    @pytest.mark.parametrize("model", REPRESENTATIVE_MODELS)
+    def test_model_defaults(self, model):
+        """Test that each model type has complete, realistic defaults."""
+        assert 0 <= model.default_supervision_requirement <= 1.0
+        assert model.default_cost_per_pr >= 0
+
+        # AI agents work 24/7, so rates should be higher than humans (3.5 baseline)
+        # but not absurdly high
+        assert 5.0 <= model.default_productivity_rate <= 15.0
+
+        # AI quality should be good but not perfect
+        # Lower than top human developers (0.95)
+        assert 0.75 <= model.default_code_quality <= 0.90
+
+    def test_all_models_bulk_invariants(self):
+        """Test default bounds across every model type at once."""
+        models = list(AIModelType)
+        rates = np.fromiter((model.default_productivity_rate for model in models), float)
+        quality = np.fromiter((model.default_code_quality for model in models), float)
+        supervision = np.fromiter((model.default_supervision_requirement for model in models), float)
+        costs = np.fromiter((model.default_cost_per_pr for model in models), float)
+
+        assert ((rates >= 5.0) & (rates <= 15.0)).all()
+        assert ((quality >= 0.75) & (quality <= 0.90)).all()
+        assert ((supervision >= 0) & (supervision <= 1.0)).all()
+        assert (costs >= 0).all()
 
     def test_cost_variations(self):
         """Test that different models have different costs."""
-        costs = [model.default_cost_per_pr for model in AIModelType]
+        models = list(AIModelType)
+        costs = np.fromiter((model.default_cost_per_pr for model in models), float)
 
         # Should have variation
-        assert min(costs) < max(costs)
+        assert costs.min() < costs.max()
 
         # CodeLlama should be cheapest (open source)
-        assert AIModelType.CODELLAMA.default_cost_per_pr == min(costs)
+        assert models[costs.argmin()] is AIModelType.CODELLAMA
 
         # Opus should be most expensive (highest quality)
-        assert AIModelType.CLAUDE_OPUS.default_cost_per_pr == max(costs)
+        assert models[costs.argmax()] is AIModelType.CLAUDE_OPUS
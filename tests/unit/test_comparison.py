@@ -2,10 +2,17 @@
 Unit tests for scenario comparison functionality.
 """
 
+import csv
+import dataclasses
+import io
+import json
+import os
+import tempfile
 import pytest
 from pathlib import Path
-from src.simulation.comparison import ScenarioComparison, ScenarioResult
-from src.simulation.config import ScenarioConfig, TeamConfigModel, SimulationConfigModel
+from src.simulation.comparison import ScenarioComparison, ScenarioResult, _run_seeded
+from src.simulation.config import TeamConfigModel, SimulationConfigModel
+from src.simulation.runner import ScenarioRunner
 
 
 class TestScenarioComparison:
@@ -28,10 +35,10 @@ class TestScenarioComparison:
         comparison = ScenarioComparison()
         assert comparison.verbose is True
 
-    def test_add_scenario_from_config(self):
+    def test_add_scenario_from_config(self, scenario_factory):
         """Test adding scenario from ScenarioConfig object."""
         comparison = ScenarioComparison(verbose=False)
-        config = ScenarioConfig(
+        config = scenario_factory(
             name="Test Scenario",
             description="Test description",
             team=TeamConfigModel(count=5),
@@ -42,6 +49,13 @@ class TestScenarioComparison:
         assert len(comparison.scenarios) == 1
         assert comparison.scenarios[0].name == "Test Scenario"
 
+    def test_scenario_factory_copies_are_independent(self, scenario_factory):
+        """Test that modifying one factory config doesn't leak into later ones."""
+        first = scenario_factory(name="A")
+        first.simulation.duration_weeks = 9
+
+        assert scenario_factory(name="B").simulation.duration_weeks == 1
+
     def test_add_scenario_from_yaml(self):
         """Test adding scenario from YAML file."""
         comparison = ScenarioComparison(verbose=False)
@@ -51,19 +65,17 @@ class TestScenarioComparison:
         assert len(comparison.scenarios) == 1
         assert "Baseline" in comparison.scenarios[0].name
 
-    def test_add_scenarios_multiple(self):
+    def test_add_scenarios_multiple(self, scenario_factory):
         """Test adding multiple scenarios at once."""
         comparison = ScenarioComparison(verbose=False)
         scenarios = [
-            ScenarioConfig(
+            scenario_factory(
                 name="Scenario 1",
-                team=TeamConfigModel(count=3),
-                simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+                team=TeamConfigModel(count=3)
             ),
-            ScenarioConfig(
+            scenario_factory(
                 name="Scenario 2",
-                team=TeamConfigModel(count=5),
-                simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+                team=TeamConfigModel(count=5)
             ),
         ]
 
@@ -72,15 +84,14 @@ class TestScenarioComparison:
         assert comparison.scenarios[0].name == "Scenario 1"
         assert comparison.scenarios[1].name == "Scenario 2"
 
-    def test_add_scenarios_mixed_types(self):
+    def test_add_scenarios_mixed_types(self, scenario_factory):
         """Test adding scenarios from mixed sources."""
         comparison = ScenarioComparison(verbose=False)
         scenarios = [
             "data/scenarios/comparison/baseline_human_only.yaml",
-            ScenarioConfig(
+            scenario_factory(
                 name="Custom Scenario",
-                team=TeamConfigModel(count=4),
-                simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+                team=TeamConfigModel(count=4)
             ),
         ]
 
@@ -94,44 +105,60 @@ class TestScenarioComparison:
         with pytest.raises(ValueError, match="No scenarios added"):
             comparison.run_all()
 
-    def test_run_all_single_scenario(self):
+    def test_run_all_single_scenario(self, baseline_comparison):
         """Test running a single scenario."""
-        comparison = ScenarioComparison(verbose=False)
-        config = ScenarioConfig(
-            name="Single Test",
-            team=TeamConfigModel(count=3),
-            simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
-        )
-        comparison.add_scenario(config)
-
-        results = comparison.run_all()
+        results = baseline_comparison.results
 
         assert len(results) == 1
-        assert len(comparison.results) == 1
-        assert results[0].name == "Single Test"
+        assert results[0].name == "Baseline"
         assert isinstance(results[0].metrics, dict)
         assert 'total_prs_merged' in results[0].metrics
 
-    def test_run_all_multiple_scenarios(self):
+    def test_run_all_multiple_scenarios(self, scenario_factory):
         """Test running multiple scenarios."""
         comparison = ScenarioComparison(verbose=False)
         scenarios = [
-            ScenarioConfig(
+            scenario_factory(
                 name=f"Scenario {i}",
-                team=TeamConfigModel(count=3 + i),
-                simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+                team=TeamConfigModel(count=3 + i)
             )
             for i in range(3)
         ]
         comparison.add_scenarios(scenarios)
 
-        results = comparison.run_all()
+        results = comparison.run_all(parallel=True, max_workers=min(len(scenarios), os.cpu_count() or 1))
 
         assert len(results) == 3
         assert len(comparison.results) == 3
         for i, result in enumerate(results):
             assert result.name == f"Scenario {i}"
 
+    def test_run_all_parallel_matches_sequential(self, scenario_factory):
+        """Test that parallel runs keep scenario order and match sequential results."""
+        scenarios = [
+            scenario_factory(
+                name=f"Scenario {i}",
+                team=TeamConfigModel(count=3 + i)
+            )
+            for i in range(3)
+        ]
+
+        # Simulate both runs rather than reusing cached seeded results. Forked
+        # workers inherit this process's cache, so clear it before each run.
+        _run_seeded.cache_clear()
+        sequential = ScenarioComparison(verbose=False)
+        sequential.add_scenarios(scenarios)
+        sequential_results = sequential.run_all()
+
+        _run_seeded.cache_clear()
+        parallel = ScenarioComparison(verbose=False)
+        parallel.add_scenarios(scenarios)
+        parallel_results = parallel.run_all(parallel=True)
+
+        assert [r.name for r in parallel_results] == [r.name for r in sequential_results]
+        for seq, par in zip(sequential_results, parallel_results):
+            assert seq.metrics == par.metrics
+
     def test_get_comparison_table_no_results(self):
         """Test getting comparison table with no results."""
         comparison = ScenarioComparison(verbose=False)
@@ -139,18 +166,9 @@ class TestScenarioComparison:
         with pytest.raises(ValueError, match="No results available"):
             comparison.get_comparison_table()
 
-    def test_get_comparison_table_with_results(self):
+    def test_get_comparison_table_with_results(self, baseline_comparison):
         """Test getting comparison table with results."""
-        comparison = ScenarioComparison(verbose=False)
-        config = ScenarioConfig(
-            name="Test Scenario",
-            team=TeamConfigModel(count=5),
-            simulation=SimulationConfigModel(duration_weeks=2, random_seed=42)
-        )
-        comparison.add_scenario(config)
-        comparison.run_all()
-
-        table = comparison.get_comparison_table()
+        table = baseline_comparison.get_comparison_table()
 
         assert isinstance(table, dict)
         assert 'scenarios' in table
@@ -158,11 +176,11 @@ class TestScenarioComparison:
         assert 'winners' in table
         assert 'insights' in table
 
-    def test_generate_insights(self):
+    def test_generate_insights(self, scenario_factory, cached_scenario_runner):
         """Test insights generation."""
         comparison = ScenarioComparison(verbose=False)
         scenarios = [
-            ScenarioConfig(
+            scenario_factory(
                 name=f"Scenario {i}",
                 team=TeamConfigModel(count=3 + i * 2),
                 simulation=SimulationConfigModel(duration_weeks=2, random_seed=42)
@@ -170,7 +188,7 @@ class TestScenarioComparison:
             for i in range(3)
         ]
         comparison.add_scenarios(scenarios)
-        comparison.run_all()
+        cached_scenario_runner(comparison)
 
         insights = comparison._generate_insights()
 
@@ -186,31 +204,58 @@ class TestScenarioComparison:
         with pytest.raises(ValueError, match="No results available"):
             comparison.export_to_json("test.json")
 
-    def test_export_to_json(self, tmp_path):
+    def test_export_to_json(self, baseline_comparison):
         """Test JSON export."""
-        comparison = ScenarioComparison(verbose=False)
-        config = ScenarioConfig(
-            name="Export Test",
-            team=TeamConfigModel(count=5),
-            simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
-        )
-        comparison.add_scenario(config)
-        comparison.run_all()
-
-        output_file = tmp_path / "test_output.json"
-        comparison.export_to_json(str(output_file))
-
-        assert output_file.exists()
+        buffer = io.StringIO()
+        baseline_comparison.export_to_json(buffer)
 
         # Verify JSON structure
-        import json
-        with open(output_file) as f:
-            data = json.load(f)
+        data = json.loads(buffer.getvalue())
 
         assert 'comparison' in data
         assert 'full_results' in data
         assert len(data['full_results']) == 1
-        assert data['full_results'][0]['name'] == "Export Test"
+        assert data['full_results'][0]['name'] == "Baseline"
+
+    def test_export_to_json_binary_handle(self, baseline_comparison):
+        """Test JSON export to a binary file object."""
+        text_buffer = io.StringIO()
+        binary_buffer = io.BytesIO()
+        baseline_comparison.export_to_json(text_buffer)
+        baseline_comparison.export_to_json(binary_buffer)
+
+        assert binary_buffer.getvalue().decode('utf-8') == text_buffer.getvalue()
+
+    def test_export_to_json_temporary_file(self, baseline_comparison):
+        """Test JSON export to text and binary tempfile wrappers."""
+        with tempfile.NamedTemporaryFile('w+') as text_file, \
+                tempfile.NamedTemporaryFile('w+b') as binary_file:
+            baseline_comparison.export_to_json(text_file)
+            baseline_comparison.export_to_json(binary_file)
+
+            text_file.seek(0)
+            binary_file.seek(0)
+            data = json.load(text_file)
+            assert json.loads(binary_file.read()) == data
+
+        assert data['full_results'][0]['name'] == "Baseline"
+
+    def test_export_reports_file_object_destination(self, baseline_comparison, capsys, tmp_path):
+        """Test that verbose exports to file objects report where they went."""
+        comparison = ScenarioComparison(verbose=True)
+        comparison.results = baseline_comparison.results
+
+        comparison.export_to_json(io.StringIO())
+        comparison.export_to_csv(io.StringIO(newline=''))
+        with open(tmp_path / "out.csv", 'w', newline='') as f:
+            comparison.export_to_csv(f)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [
+            "Comparison exported to: stream",
+            "Comparison exported to: stream",
+            f"Comparison exported to: {tmp_path / 'out.csv'}",
+        ]
 
     def test_export_to_csv_no_results(self):
         """Test CSV export with no results."""
@@ -219,38 +264,24 @@ class TestScenarioComparison:
         with pytest.raises(ValueError, match="No results available"):
             comparison.export_to_csv("test.csv")
 
-    def test_export_to_csv(self, tmp_path):
+    def test_export_to_csv(self, baseline_comparison):
         """Test CSV export."""
-        comparison = ScenarioComparison(verbose=False)
-        config = ScenarioConfig(
-            name="CSV Test",
-            team=TeamConfigModel(count=5),
-            simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
-        )
-        comparison.add_scenario(config)
-        comparison.run_all()
-
-        output_file = tmp_path / "test_output.csv"
-        comparison.export_to_csv(str(output_file))
-
-        assert output_file.exists()
+        buffer = io.StringIO(newline='')
+        baseline_comparison.export_to_csv(buffer)
 
         # Verify CSV structure
-        import csv
-        with open(output_file) as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        buffer.seek(0)
+        rows = list(csv.DictReader(buffer))
 
         # CSV has metrics as rows, scenarios as columns
         assert len(rows) > 0
         assert 'Metric' in rows[0]
 
-    def test_scenario_result_creation(self):
+    def test_scenario_result_creation(self, scenario_factory):
         """Test ScenarioResult dataclass creation."""
-        config = ScenarioConfig(
+        config = scenario_factory(
             name="Test",
-            team=TeamConfigModel(count=5),
-            simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+            team=TeamConfigModel(count=5)
         )
         result = ScenarioResult(
             name="Test",
@@ -264,12 +295,11 @@ class TestScenarioComparison:
         assert result.metrics['prs_merged'] == 100
         assert result.config.name == "Test"
 
-    def test_scenario_result_get_metric(self):
+    def test_scenario_result_get_metric(self, scenario_factory):
         """Test ScenarioResult get_metric method."""
-        config = ScenarioConfig(
+        config = scenario_factory(
             name="Test",
-            team=TeamConfigModel(count=5),
-            simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+            team=TeamConfigModel(count=5)
         )
         result = ScenarioResult(
             name="Test",
@@ -282,23 +312,30 @@ class TestScenarioComparison:
         assert result.get_metric('nonexistent') == 0
         assert result.get_metric('nonexistent', 99) == 99
 
-    def test_comparison_preserves_random_seed(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.name = "Renamed"
+
+    def test_comparison_preserves_random_seed(self, scenario_factory):
         """Test that scenarios with same seed produce consistent results."""
-        config1 = ScenarioConfig(
+        config1 = scenario_factory(
             name="Run 1",
             team=TeamConfigModel(count=5),
             simulation=SimulationConfigModel(duration_weeks=2, random_seed=42)
         )
-        config2 = ScenarioConfig(
+        config2 = scenario_factory(
             name="Run 2",
             team=TeamConfigModel(count=5),
             simulation=SimulationConfigModel(duration_weeks=2, random_seed=42)
         )
 
+        # Simulate both runs rather than reusing cached seeded results
+        _run_seeded.cache_clear()
         comparison1 = ScenarioComparison(verbose=False)
         comparison1.add_scenario(config1)
         results1 = comparison1.run_all()
 
+        _run_seeded.cache_clear()
+
         comparison2 = ScenarioComparison(verbose=False)
         comparison2.add_scenario(config2)
         results2 = comparison2.run_all()
@@ -307,21 +344,65 @@ class TestScenarioComparison:
         assert results1[0].metrics['total_prs_merged'] == results2[0].metrics['total_prs_merged']
         assert results1[0].metrics['prs_per_week'] == results2[0].metrics['prs_per_week']
 
-    def test_winner_identification_highest_is_better(self):
+    def test_seeded_results_are_cached(self, scenario_factory):
+        """Test that rerunning a seeded scenario reuses its metrics without sharing them."""
+        config = scenario_factory(
+            name="Cached",
+            team=TeamConfigModel(count=3),
+            simulation=SimulationConfigModel(duration_weeks=1, random_seed=7)
+        )
+        renamed = config.model_copy(update={'name': "Cached Again"})
+
+        first = ScenarioComparison(verbose=False)
+        first.add_scenario(config)
+        results1 = first.run_all()
+
+        hits = _run_seeded.cache_info().hits
+        second = ScenarioComparison(verbose=False)
+        second.add_scenario(renamed)
+        results2 = second.run_all()
+
+        assert _run_seeded.cache_info().hits == hits + 1
+        assert results2[0].name == "Cached Again"
+        assert results2[0].metrics == results1[0].metrics
+        assert results2[0].metrics is not results1[0].metrics
+
+    def test_metrics_disk_cache(self, scenario_factory, metrics_cache, monkeypatch):
+        """Test that seeded metrics from a parallel run are reused from disk."""
+        config = scenario_factory(name="On Disk", team=TeamConfigModel(count=3))
+
+        # Workers don't touch the shelf; the parent stores their results
+        first = ScenarioComparison(verbose=False)
+        first.add_scenario(config)
+        results1 = first.run_all(parallel=True, max_workers=1)
+
+        assert any(metrics_cache.iterdir())
+
+        def fail_run(self, verbose=True):
+            raise AssertionError("scenario should have been served from the disk cache")
+
+        _run_seeded.cache_clear()
+        monkeypatch.setattr(ScenarioRunner, "run", fail_run)
+
+        second = ScenarioComparison(verbose=False)
+        second.add_scenario(config)
+        results2 = second.run_all()
+
+        assert results2[0].metrics == results1[0].metrics
+
+    def test_winner_identification_highest_is_better(self, scenario_factory):
         """Test that winner identification correctly identifies highest values for throughput metrics."""
         comparison = ScenarioComparison(verbose=False)
 
         # Create scenarios with known different throughputs
         scenarios = [
-            ScenarioConfig(
+            scenario_factory(
                 name="Small Team",
-                team=TeamConfigModel(count=2),
-                simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+                team=TeamConfigModel(count=2)
             ),
-            ScenarioConfig(
+            scenario_factory(
                 name="Large Team",
-                team=TeamConfigModel(count=8),
-                simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+                team=TeamConfigModel(count=8)
             ),
         ]
         comparison.add_scenarios(scenarios)
@@ -338,6 +419,33 @@ class TestScenarioComparison:
         # Winner for prs_per_week should be the large team
         assert table['metrics']['prs_per_week']['best_scenario'] == "Large Team"
 
+    def test_winner_ties_and_zero_values(self, scenario_factory):
+        """Test that ties go to the first scenario and zeros never win lower-is-better metrics."""
+        comparison = ScenarioComparison(verbose=False)
+        config = scenario_factory()
+        metrics = [
+            {'prs_per_week': 4.0, 'change_failure_rate': 0.0, 'ai_agents': 0},
+            {'prs_per_week': 5.0, 'change_failure_rate': 0.2, 'ai_agents': 1, 'ai_total_cost': 10.0},
+            {'prs_per_week': 5.0, 'change_failure_rate': 0.1, 'ai_agents': 1, 'ai_total_cost': 10.0},
+        ]
+        comparison.results = [
+            ScenarioResult(name=f"S{i}", description=None, metrics=m, config=config)
+            for i, m in enumerate(metrics)
+        ]
+
+        table = comparison.get_comparison_table()
+
+        assert table['winners']['prs_per_week'] == "S1"
+        assert table['winners']['change_failure_rate'] == "S2"
+        assert table['winners']['ai_total_cost'] == "S1"
+        assert 'ai_prs_per_week' not in table['winners']
+        assert table['metrics']['ai_agents']['values'] == [0, 1, 1]
+        assert table['insights'][:3] == [
+            "Highest throughput: S1 with 5.0 PRs/week",
+            "Best quality: S2 with 10.0% failure rate",
+            "Most cost-efficient: S1 with 0.5 PRs/$",
+        ]
+
     def test_print_comparison_no_results(self):
         """Test print_comparison with no results raises error."""
         comparison = ScenarioComparison(verbose=False)
@@ -345,25 +453,23 @@ class TestScenarioComparison:
         with pytest.raises(ValueError, match="No results available"):
             comparison.print_comparison()
 
-    def test_print_comparison_does_not_crash(self, capsys):
+    def test_print_comparison_does_not_crash(self, scenario_factory, capsys, cached_scenario_runner):
         """Test that print_comparison produces output without crashing."""
         comparison = ScenarioComparison(verbose=False)
 
         scenarios = [
-            ScenarioConfig(
+            scenario_factory(
                 name="Scenario A",
-                team=TeamConfigModel(count=3),
-                simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+                team=TeamConfigModel(count=3)
             ),
-            ScenarioConfig(
+            scenario_factory(
                 name="Scenario B",
-                team=TeamConfigModel(count=5),
-                simulation=SimulationConfigModel(duration_weeks=1, random_seed=42)
+                team=TeamConfigModel(count=5)
             ),
         ]
 
         comparison.add_scenarios(scenarios)
-        comparison.run_all()
+        cached_scenario_runner(comparison)
 
         # Should not raise any exceptions
         comparison.print_comparison()
@@ -2,11 +2,14 @@
 Unit tests for the Developer agent.
 """
 
+import random
+
 import pytest
 
 from src.simulation.agents.developer import Developer, DeveloperConfig
 from src.simulation.models.types import ExperienceLevel
 from src.simulation.base import SimulationContext
+from src.simulation.models.work import PullRequest
 
 
 class TestDeveloperConfig:
@@ -94,6 +97,16 @@ class TestDeveloper:
         assert dev.is_fully_onboarded
         assert dev.config.current_productivity_multiplier == 1.0
 
+    def test_no_onboarding_time(self):
+        """Test that a developer with no onboarding time is fully productive at once."""
+        dev = Developer(config=DeveloperConfig(onboarding_time=0))
+        dev.on_added_to_simulation(timestep=0)
+
+        dev._update_onboarding(SimulationContext(current_day=0, current_week=0))
+
+        assert dev.is_fully_onboarded
+        assert dev.config.current_productivity_multiplier == 1.0
+
     def test_create_pr(self):
         """Test PR creation."""
         dev = Developer()
@@ -125,6 +138,21 @@ class TestDeveloper:
         assert dev.total_prs_merged == 1
         assert len(dev.active_prs) == 0
 
+    def test_work_on_reviews(self):
+        """Test that completed reviews leave the pending list and the rest stay."""
+        dev = Developer(config=DeveloperConfig(review_capacity=2.5))  # 50% per day
+        context = SimulationContext(current_day=5, current_week=0, rng=random.Random(1))
+        reviews = [dev.assign_review(PullRequest(author_id="other"), context) for _ in range(10)]
+        pending = dev.pending_reviews
+
+        dev._work_on_reviews(context)
+
+        completed = [r for r in reviews if r.is_complete]
+        assert 0 < len(completed) < len(reviews)
+        assert dev.total_reviews_completed == len(completed)
+        assert dev.pending_reviews is pending
+        assert dev.pending_reviews == [r for r in reviews if not r.is_complete]
+
     def test_revert_pr(self):
         """Test PR reversion."""
         dev = Developer()
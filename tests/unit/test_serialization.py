@@ -0,0 +1,31 @@
+"""
+Unit tests for JSON serialization helpers.
+"""
+
+import json
+
+from src.simulation import serialization
+from src.simulation.serialization import dumps_json
+
+
+class TestDumpsJson:
+    """Test dumps_json with and without orjson."""
+
+    DATA = {"name": "café", "values": [1, 2.5, None], "nested": {"ok": True}}
+
+    def test_round_trip(self):
+        """Test that output decodes back to the original object."""
+        assert json.loads(dumps_json(self.DATA)) == self.DATA
+        assert json.loads(dumps_json(self.DATA, indent=True)) == self.DATA
+
+    def test_indent_uses_two_spaces(self):
+        """Test that indented output matches json's indent=2 layout."""
+        out = dumps_json({"a": [1]}, indent=True).decode("utf-8")
+        assert out == json.dumps({"a": [1]}, indent=2)
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test falling back to the json module when orjson is unavailable."""
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+        out = dumps_json(self.DATA, indent=True)
+        assert isinstance(out, bytes)
+        assert json.loads(out) == self.DATA
@@ -2,6 +2,9 @@
 Unit tests for the base Simulation class.
 """
 
+import dataclasses
+import random
+
 import pytest
 
 from src.simulation.base import Simulation, Agent, SimulationContext, SimulationEvent
@@ -119,7 +122,7 @@ class TestSimulation:
         type_a_events = sim.get_events_by_type("type_a")
 
         assert len(type_a_events) == 2
-        assert all(e.event_type == "type_a" for e in type_a_events)
+        assert {e.event_type for e in type_a_events} == {"type_a"}
 
     def test_get_events_by_agent(self):
         """Test filtering events by agent."""
@@ -132,7 +135,47 @@ class TestSimulation:
         agent1_events = sim.get_events_by_agent("agent1")
 
         assert len(agent1_events) == 2
-        assert all(e.agent_id == "agent1" for e in agent1_events)
+        assert {e.agent_id for e in agent1_events} == {"agent1"}
+
+    def test_event_lookups_cleared_on_reset(self):
+        """Test that event lookups are empty after a reset."""
+        sim = Simulation()
+
+        sim.log_event("type_a", agent_id="agent1")
+        sim.reset()
+
+        assert sim.get_events_by_type("type_a") == []
+        assert sim.get_events_by_agent("agent1") == []
+
+    def test_log_events_disabled(self):
+        """Test that disabling event logging still returns events but records none."""
+        sim = Simulation(log_events=False)
+        agent = TestAgent()
+
+        sim.add_agent(agent)
+        event = sim.log_event("type_a", agent_id="agent1", data={"key": "value"})
+
+        assert event.event_type == "type_a"
+        assert sim.events == []
+        assert sim.get_events_by_type("type_a") == []
+        assert sim.get_events_by_agent(agent.agent_id) == []
+
+    def test_seeded_rng_is_per_simulation(self):
+        """Test that seeded simulations own their RNG and leave the global one alone."""
+        state = random.getstate()
+
+        sim1 = Simulation(random_seed=7)
+        sim2 = Simulation(random_seed=7)
+
+        assert sim1.rng is not sim2.rng
+        assert [sim1.rng.random() for _ in range(3)] == [sim2.rng.random() for _ in range(3)]
+        assert random.getstate() == state
+
+    def test_context_carries_rng(self):
+        """Test that agents receive the simulation's RNG through the context."""
+        sim = Simulation(random_seed=7)
+
+        assert sim.get_context().rng is sim.rng
 
 
 class TestSimulationContext:
@@ -157,6 +200,13 @@ class TestSimulationContext:
 
         assert context.current_timestep == context.current_day
 
+    def test_context_is_immutable(self):
+        """Test that agents can't modify the shared step context."""
+        context = SimulationContext(current_day=10, current_week=1)
+
+        with pytest.raises(AttributeError):
+            context.current_day = 11
+
 
 class TestSimulationEvent:
     """Test SimulationEvent."""
@@ -175,3 +225,14 @@ class TestSimulationEvent:
         assert event.agent_id == "dev123"
         assert event.data["pr_id"] == "pr456"
         assert event.event_id is not None
+
+    def test_event_defaults_and_immutability(self):
+        """Test that events default to empty data and can't be modified once created."""
+        event = SimulationEvent(event_type="incident_created", timestep=3)
+
+        assert event.agent_id is None
+        assert event.data == {}
+        assert event.event_id != SimulationEvent(event_type="incident_created", timestep=3).event_id
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.timestep = 4